@@ -52,7 +52,7 @@ class BatchProcessor:
         """
         self._validate_object_session_alignment(objects, sessions)
 
-        self.logger.info(f"新規作成: {len(objects)}件のオブジェクトをAnytypeに作成します")
+        self.logger.info("新規作成: %d件のオブジェクトをAnytypeに作成します", len(objects))
         success_count = 0
         error_count = 0
 
@@ -81,12 +81,12 @@ class BatchProcessor:
                         # キャッシュにanytype_object_idを保存
                         self.cache_manager.save_session(session, anytype_object_id)
                         self.logger.debug(
-                            f"anytype_object_idをキャッシュに保存: "
-                            f"session_id={session.id}, object_id={anytype_object_id}"
+                            "anytype_object_idをキャッシュに保存: session_id=%s, object_id=%s",
+                            session.id, anytype_object_id
                         )
                     else:
                         self.logger.warning(
-                            f"APIレスポンスにobject_idが含まれていません: session_id={session.id}"
+                            "APIレスポンスにobject_idが含まれていません: session_id=%s", session.id
                         )
 
                 success_count += len(batch_success_indices)
@@ -95,9 +95,9 @@ class BatchProcessor:
                 # 成功したセッションはanytype_object_idを保存した時点でstatus='sent'になっているため、
                 # キャッシュを削除する必要はない（次回のDiffフェーズで比較に使用するため保持）
 
-                self.logger.info(f"  新規作成進捗: {success_count}/{len(objects)} 件")
+                self.logger.info("  新規作成進捗: %d/%d 件", success_count, len(objects))
                 if batch_error_indices:
-                    self.logger.warning(f"  {len(batch_error_indices)}件のオブジェクトでエラーが発生しました")
+                    self.logger.warning("  %d件のオブジェクトでエラーが発生しました", len(batch_error_indices))
                     # エラーが発生したオブジェクトのみを個別に再試行
                     error_objects = [batch[idx] for idx in batch_error_indices]
                     error_sessions = [batch_sessions[idx] for idx in batch_error_indices]
@@ -106,7 +106,7 @@ class BatchProcessor:
                     error_count += errors - len(batch_error_indices)  # 既にカウント済みなので調整
             except Exception as e:
                 self.logger.error(
-                    f"  バッチ作成エラー ({i+1}-{min(i+self.batch_size, len(objects))}件): {e}"
+                    "  バッチ作成エラー (%d-%d件): %s", i + 1, min(i + self.batch_size, len(objects)), e
                 )
                 # 個別に再試行
                 success, errors = self._create_individually(batch, i, batch_sessions)
@@ -135,7 +135,8 @@ class BatchProcessor:
                 f"objects={len(objects)}, update_list={len(update_list)}"
             )
 
-        self.logger.info(f"更新: {len(objects)}件のオブジェクトをAnytypeに更新します")
+        total = len(objects)
+        self.logger.info("更新: %d件のオブジェクトをAnytypeに更新します", total)
         success_count = 0
         error_count = 0
 
@@ -146,20 +147,20 @@ class BatchProcessor:
                 if "error" in result:
                     error_count += 1
                     self.logger.error(
-                        f"  更新エラー (オブジェクト {obj_idx + 1}, {obj.name}): {result.get('error')}"
+                        "  更新エラー (オブジェクト %d, %s): %s", obj_idx + 1, obj.name, result.get("error")
                     )
                 else:
                     success_count += 1
                     # 成功したセッションのデータをキャッシュに保存（anytype_object_idを保持し、status='sent'に設定）
                     self.cache_manager.save_session(session, anytype_object_id)
-                    self.logger.debug(f"  更新成功: {obj_idx + 1} ({obj.name})")
+                    self.logger.debug("  更新成功: %d (%s)", obj_idx + 1, obj.name)
 
                 # 進捗表示
-                if (obj_idx + 1) % self.batch_size == 0 or obj_idx == len(objects) - 1:
-                    self.logger.info(f"  更新進捗: {obj_idx + 1}/{len(objects)} 件")
+                if (obj_idx + 1) % self.batch_size == 0 or obj_idx == total - 1:
+                    self.logger.info("  更新進捗: %d/%d 件", obj_idx + 1, total)
             except Exception as e:
                 error_count += 1
-                self.logger.error(f"  更新エラー (オブジェクト {obj_idx + 1}, {obj.name}): {e}")
+                self.logger.error("  更新エラー (オブジェクト %d, %s): %s", obj_idx + 1, obj.name, e)
 
         return success_count, error_count
 
@@ -208,9 +209,9 @@ class BatchProcessor:
                     success_sessions = [batch_sessions[idx] for idx in batch_success_indices]
                     self.cache_manager.delete_sessions(success_sessions)
 
-                self.logger.info(f"  {success_count}/{len(objects)} 件を追加しました")
+                self.logger.info("  %d/%d 件を追加しました", success_count, len(objects))
                 if batch_error_indices:
-                    self.logger.warning(f"  {len(batch_error_indices)}件のオブジェクトでエラーが発生しました")
+                    self.logger.warning("  %d件のオブジェクトでエラーが発生しました", len(batch_error_indices))
                     # エラーが発生したオブジェクトのみを個別に再試行
                     if batch_sessions:
                         error_objects = [batch[idx] for idx in batch_error_indices]
@@ -220,7 +221,7 @@ class BatchProcessor:
                         error_count += errors - len(batch_error_indices)  # 既にカウント済みなので調整
             except Exception as e:
                 self.logger.error(
-                    f"  バッチ追加エラー ({i+1}-{min(i+self.batch_size, len(objects))}件): {e}"
+                    "  バッチ追加エラー (%d-%d件): %s", i + 1, min(i + self.batch_size, len(objects)), e
                 )
                 # create_objectsが例外を投げた場合、部分的に成功している可能性がある
                 # キャッシュをチェックして、既に作成済みの可能性があるオブジェクトを特定する
@@ -237,8 +238,9 @@ class BatchProcessor:
 
                     if potentially_created:
                         self.logger.warning(
-                            f"  バッチ内の {len(potentially_created)}件のオブジェクトは"
-                            f" キャッシュに存在しません（既に作成済みの可能性があります）"
+                            "  バッチ内の %d件のオブジェクトは"
+                            " キャッシュに存在しません（既に作成済みの可能性があります）",
+                            len(potentially_created)
                         )
                         # キャッシュに存在しないオブジェクトをスキップして再試行を避ける
                         # これにより重複作成を防ぐ
@@ -253,8 +255,8 @@ class BatchProcessor:
                                 # 成功としてカウントしない（キャッシュの欠落は成功の証拠ではない）
                                 skipped_count += 1
                                 self.logger.debug(
-                                    f"  オブジェクト {i + obj_idx + 1} ({obj.name}) をスキップ"
-                                    f" (キャッシュに存在しない)"
+                                    "  オブジェクト %d (%s) をスキップ (キャッシュに存在しない)",
+                                    i + obj_idx + 1, obj.name
                                 )
                             else:
                                 retry_objects.append(obj)
@@ -262,8 +264,9 @@ class BatchProcessor:
 
                         if skipped_count > 0:
                             self.logger.info(
-                                f"  {skipped_count}件のオブジェクトをスキップしました"
-                                f"（キャッシュに存在しないため、既に作成済みの可能性があります）"
+                                "  %d件のオブジェクトをスキップしました"
+                                "（キャッシュに存在しないため、既に作成済みの可能性があります）",
+                                skipped_count
                             )
 
                         # キャッシュに残っているオブジェクトのみを再試行
@@ -357,11 +360,11 @@ class BatchProcessor:
                     session = sessions[obj_idx]
                     self.cache_manager.save_session(session, anytype_object_id)
                     self.logger.debug(
-                        f"anytype_object_idをキャッシュに保存: "
-                        f"session_id={session.id}, object_id={anytype_object_id}"
+                        "anytype_object_idをキャッシュに保存: session_id=%s, object_id=%s",
+                        session.id, anytype_object_id
                     )
                 success_count += 1
-                self.logger.info(f"  個別作成成功: {start_index + obj_idx + 1} ({obj.name})")
+                self.logger.info("  個別作成成功: %d (%s)", start_index + obj_idx + 1, obj.name)
 
                 # 成功したセッションはanytype_object_idを保存した時点でstatus='sent'になっているため、
                 # キャッシュを削除する必要はない（次回のDiffフェーズで比較に使用するため保持）
@@ -406,8 +409,8 @@ class BatchProcessor:
                 try:
                     self.object_manager.create_object(obj)
                     success_count += 1
-                    self.logger.info(f"  個別追加成功: {start_index + obj_idx + 1} ({obj.name})")
+                    self.logger.info("  個別追加成功: %d (%s)", start_index + obj_idx + 1, obj.name)
                 except Exception as e:
                     error_count += 1
-                    self.logger.error(f"  個別追加エラー (オブジェクト {start_index + obj_idx + 1}, {obj.name}): {e}")
+                    self.logger.error("  個別追加エラー (オブジェクト %d, %s): %s", start_index + obj_idx + 1, obj.name, e)
             return success_count, error_count
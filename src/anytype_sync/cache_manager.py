@@ -3,10 +3,15 @@
 Anytype同期処理におけるキャッシュ管理のヘルパークラスです。
 """
 import logging
+import sqlite3
 from typing import List, Optional
 from src.payloads import ProjectSession
 from src.cache import CacheBase
 
+# キャッシュ操作で想定されるエラー(DBエラー、ファイルI/Oエラー、JSONシリアライズエラー)
+# それ以外の予期しない例外は握りつぶさずに呼び出し元へ伝播させる
+_CACHE_ERRORS = (sqlite3.Error, OSError, TypeError, ValueError)
+
 
 class CacheManager:
     """キャッシュ管理ヘルパークラス
@@ -33,8 +38,8 @@ class CacheManager:
         """
         try:
             self.cache.save(session, anytype_object_id)
-        except Exception as e:
-            self.logger.warning(f"キャッシュ保存エラー (session_id={session.id}): {e}")
+        except _CACHE_ERRORS as e:
+            self.logger.warning("キャッシュ保存エラー (session_id=%s): %s", session.id, e)
 
     def delete_sessions(self, sessions: List[ProjectSession]) -> None:
         """成功したセッションのキャッシュを削除
@@ -45,9 +50,9 @@ class CacheManager:
         for session in sessions:
             try:
                 self.cache.delete(session.id)
-                self.logger.debug(f"キャッシュ削除: session_id={session.id}")
-            except Exception as e:
-                self.logger.warning(f"キャッシュ削除エラー (session_id={session.id}): {e}")
+                self.logger.debug("キャッシュ削除: session_id=%s", session.id)
+            except _CACHE_ERRORS as e:
+                self.logger.warning("キャッシュ削除エラー (session_id=%s): %s", session.id, e)
 
     def get_session(self, session_id: int):
         """キャッシュからセッションを取得
@@ -3,10 +3,13 @@
 42のプロジェクトセッション情報を取得し、Anytypeに同期する処理を担当します。
 """
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from auth42 import Auth42
+from auth42.exceptions import AuthenticationError
 from src.config import Config, get_default_cache_path
 from src.fortytwo_api import Project42
 from src.payloads import ProjectSession
@@ -122,11 +125,17 @@ class ProjectSessionSyncer:
     ) -> List[ProjectSession]:
         """プロジェクトセッションの詳細情報を取得（Fetchフェーズ）
 
+        詳細情報の取得はI/O待ちが支配的なため、セッション単位で並列に取得します。
+        同時に処理するセッション数は config.detail_fetch_workers を上限とし、
+        さらにレート制限(requests_per_second)とコネクションプールの上限
+        (http_pool_maxsize)を超えないよう制限します。
+
         Args:
             sessions: プロジェクトセッションのリスト
 
         Returns:
-            詳細情報が追加されたプロジェクトセッションのリスト
+            詳細情報が追加されたプロジェクトセッションのリスト(入力と同じ順序、
+            認証エラーで詳細情報を取得できなかったセッションは含まない)
 
         Note:
             このメソッドではキャッシュに保存しません。
@@ -135,36 +144,72 @@ class ProjectSessionSyncer:
         """
         self.logger.info("Fetchフェーズ: 詳細情報を取得中...")
         sessions_with_details = []
-
-        for idx, session in enumerate(sessions, 1):
-            try:
-                session_with_details = self.project42.get_project_session_with_details(session)
+        total = len(sessions)
+        # 各セッションの詳細情報は1スレッド内で順に取得するため、同時リクエスト数はスレッド数と一致する
+        max_workers = max(1, min(
+            self.config.detail_fetch_workers,
+            math.ceil(self.config.requests_per_second),
+            self.config.http_pool_maxsize,
+            total,
+        ))
+
+        # ループ内のログは%形式で渡し、ログレベルで抑制される場合の文字列生成を避ける
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._fetch_session_details, sessions)
+            for idx, session_with_details in enumerate(results, 1):
+                if session_with_details is None:
+                    continue
                 sessions_with_details.append(session_with_details)
 
                 # 進捗表示
                 if idx % self.config.detail_fetch_interval == 0:
                     self.logger.info(
-                        f"  詳細情報取得進捗: {idx}/{len(sessions)} "
-                        f"(プロジェクト: {session.project_name})"
+                        "  詳細情報取得進捗: %d/%d (プロジェクト: %s)",
+                        idx, total, session_with_details.project_name
                     )
-            except Project42Error as e:
-                self.logger.warning(
-                    f"セッションID {session.id} ({session.project_name}) の詳細情報取得に失敗: {e}"
-                )
-                # 詳細情報が取得できなくても基本情報は残す
-                sessions_with_details.append(session)
-            except Exception as e:
-                self.logger.warning(
-                    f"セッションID {session.id} ({session.project_name}) の詳細情報取得に予期しないエラーが発生: {e}"
-                )
-                # 詳細情報が取得できなくても基本情報は残す
-                sessions_with_details.append(session)
 
         self.logger.info(
-            f"Fetchフェーズ完了: {len(sessions_with_details)}件のプロジェクトセッションの詳細情報を取得しました"
+            "Fetchフェーズ完了: %d件のプロジェクトセッションの詳細情報を取得しました",
+            len(sessions_with_details)
         )
         return sessions_with_details
 
+    def _fetch_session_details(self, session: ProjectSession) -> Optional[ProjectSession]:
+        """1件のプロジェクトセッションの詳細情報を取得
+
+        Args:
+            session: プロジェクトセッション
+
+        Returns:
+            詳細情報が追加されたプロジェクトセッション(取得失敗時は基本情報のみ)。
+            認証エラーが続いた場合はNone(空の詳細情報でAnytypeを上書きしないよう同期対象から外し、
+            sync() でエラーとして数える)
+        """
+        try:
+            try:
+                return self.project42.get_project_session_with_details(session)
+            except AuthenticationError:
+                # 無効になった認証ヘッダーは破棄済みのため、新しいヘッダーで1回だけ再試行する
+                return self.project42.get_project_session_with_details(session)
+        except AuthenticationError as e:
+            self.logger.warning(
+                "セッションID %s (%s) の詳細情報取得で認証エラーが発生したため、同期対象から外します: %s",
+                session.id, session.project_name, e
+            )
+            return None
+        except Project42Error as e:
+            self.logger.warning(
+                "セッションID %s (%s) の詳細情報取得に失敗: %s",
+                session.id, session.project_name, e
+            )
+        except Exception as e:
+            self.logger.warning(
+                "セッションID %s (%s) の詳細情報取得に予期しないエラーが発生: %s",
+                session.id, session.project_name, e
+            )
+        # 詳細情報が取得できなくても基本情報は残す
+        return session
+
     def _sessions_are_equal(self, session1: ProjectSession, session2: ProjectSession) -> bool:
         """2つのセッションが等しいかどうかを比較
 
@@ -235,8 +280,9 @@ class ProjectSessionSyncer:
                     else:
                         # anytype_object_idがない場合は新規として扱う
                         self.logger.warning(
-                            f"セッションID {session.id} はキャッシュに存在しますが、"
-                            f"anytype_object_idがありません。新規として扱います。"
+                            "セッションID %s はキャッシュに存在しますが、"
+                            "anytype_object_idがありません。新規として扱います。",
+                            session.id
                         )
                         create_list.append(session)
 
@@ -312,6 +358,8 @@ class ProjectSessionSyncer:
 
             # 詳細情報を取得
             sessions_with_details = self.fetch_details(sessions)
+            # 認証エラーで詳細情報を取得できず同期対象から外したセッションはエラーとして数える
+            result.error_count += len(sessions) - len(sessions_with_details)
 
             # ===== フェーズ2: Diff（差分検出フェーズ） =====
             self.logger.info("=" * 60)
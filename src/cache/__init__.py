@@ -4,8 +4,10 @@
 """
 from .base import CacheBase
 from .sqlite_cache import SQLiteCache
+from .ttl_cache import TTLCache
 
 __all__ = [
     "CacheBase",
     "SQLiteCache",
+    "TTLCache",
 ]
@@ -2,17 +2,26 @@
 
 SQLiteを使用したキャッシュの実装です。
 """
-import json
 import sqlite3
 import logging
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime, timezone
 
+import orjson
+
 from src.cache.base import CacheBase
 from src.payloads import ProjectSession
 
 
+def _dump_session(session: ProjectSession) -> str:
+    """セッションをキャッシュ保存用のJSON文字列に変換
+
+    orjsonはデータクラスを直接シリアライズできるため、to_dictによる中間の辞書を作りません。
+    """
+    return orjson.dumps(session).decode("utf-8")
+
+
 class SQLiteCache(CacheBase):
     """SQLiteを使用したキャッシュ実装"""
 
@@ -64,7 +73,7 @@ class SQLiteCache(CacheBase):
             anytype_object_id: AnytypeオブジェクトID（オプション）
         """
         try:
-            data_json = json.dumps(session.to_dict(), ensure_ascii=False)
+            data_json = _dump_session(session)
             now = datetime.now(timezone.utc).isoformat()
 
             with self._get_connection() as conn:
@@ -118,7 +127,7 @@ class SQLiteCache(CacheBase):
                 if row is None:
                     return None
 
-                data_dict = json.loads(row["data"])
+                data_dict = orjson.loads(row["data"])
                 return ProjectSession(**data_dict)
         except Exception as e:
             self.logger.error(f"キャッシュ取得エラー (session_id={session_id}): {e}", exc_info=True)
@@ -138,7 +147,7 @@ class SQLiteCache(CacheBase):
                 )
                 for row in cursor:
                     try:
-                        data_dict = json.loads(row["data"])
+                        data_dict = orjson.loads(row["data"])
                         sessions.append(ProjectSession(**data_dict))
                     except Exception as e:
                         self.logger.warning(f"キャッシュデータの復元エラー: {e}")
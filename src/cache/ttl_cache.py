@@ -0,0 +1,76 @@
+"""TTL付きメモリキャッシュ
+
+有効期限付きでAPIレスポンスなどをメモリ上に保持する軽量なキャッシュです。
+"""
+import time
+from threading import Lock
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """有効期限付きのメモリキャッシュ
+
+    複数スレッドから同時に利用できます。
+    保持件数が maxsize を超えた場合は、最も長く参照されていないエントリから削除します(LRU)。
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        """TTLキャッシュの初期化
+
+        Args:
+            maxsize: 保持する最大エントリ数
+            ttl: エントリの有効期間(秒)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[K, Tuple[V, float]] = {}
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """キャッシュから値を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた値(存在しない、または期限切れの場合はNone)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            # 参照されたエントリを末尾(最新)に移動する
+            del self._data[key]
+            self._data[key] = entry
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """キャッシュに値を保存
+
+        Args:
+            key: キャッシュキー
+            value: 保存する値
+            ttl: このエントリの有効期間(秒、Noneの場合はデフォルト値)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            # 再登録時は末尾に移動させるため一度削除する
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (value, expires_at)
+
+    def clear(self) -> None:
+        """キャッシュをクリア"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
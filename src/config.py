@@ -29,6 +29,7 @@ class Config:
     log_file: str = "logs/get_42_projects.log"
     batch_size: int = 50
     detail_fetch_interval: int = 10  # 詳細情報取得の進捗表示間隔
+    detail_fetch_workers: int = 4  # 詳細情報取得の並列ワーカー数(1の場合は逐次取得)
 
     # キャッシュ設定
     cache_db_path: Optional[Path] = None  # SQLiteキャッシュファイルのパス(Noneの場合はデフォルトパス)
@@ -38,6 +39,8 @@ class Config:
     rate_limit_threshold: int = 10  # レート制限残りがこの値以下になったら待機
     base_delay: float = 0.5  # 基本待機時間(秒)
     max_delay: float = 60.0  # 最大待機時間(秒)
+    http_pool_maxsize: int = 16  # 42 APIへの同時接続を保持する上限数
+    requests_per_second: float = 2.0  # 42 APIへの1秒あたりの最大リクエスト数
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -63,10 +66,13 @@ class Config:
             log_file=os.getenv("LOG_FILE", "logs/get_42_projects.log"),
             batch_size=_get_int_env("BATCH_SIZE", default=50),
             detail_fetch_interval=_get_int_env("DETAIL_FETCH_INTERVAL", default=10),
+            detail_fetch_workers=_get_int_env("DETAIL_FETCH_WORKERS", default=4),
             max_retries=_get_int_env("MAX_RETRIES", default=3),
             rate_limit_threshold=_get_int_env("RATE_LIMIT_THRESHOLD", default=10),
             base_delay=_get_float_env("BASE_DELAY", default=0.5),
             max_delay=_get_float_env("MAX_DELAY", default=60.0),
+            http_pool_maxsize=_get_int_env("HTTP_POOL_MAXSIZE", default=16),
+            requests_per_second=_get_float_env("REQUESTS_PER_SECOND", default=2.0),
             cache_db_path=_get_path_env("CACHE_DB_PATH"),
         )
 
@@ -87,6 +93,10 @@ class Config:
         if not self.anytype_space_id:
             errors.append("ANYTYPE_SPACE_ID が設定されていません")
             missing_fields.append("ANYTYPE_SPACE_ID")
+        if self.requests_per_second <= 0:
+            errors.append(f"REQUESTS_PER_SECOND は正の数を指定してください (現在: {self.requests_per_second})")
+        if self.http_pool_maxsize <= 0:
+            errors.append(f"HTTP_POOL_MAXSIZE は正の整数を指定してください (現在: {self.http_pool_maxsize})")
 
         if errors:
             raise ConfigurationError("\n".join(errors), missing_fields=missing_fields)
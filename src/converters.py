@@ -69,6 +69,30 @@ def format_rules(rules: List[Dict[str, Any]]) -> List[str]:
     return rule_descriptions
 
 
+# ボディの固定部分のテンプレート(モジュール読み込み時に一度だけ組み立てる)
+# 各行は最終的に "\n" で連結されるため、テンプレート内でも同じ区切りで連結しておく
+_BASIC_INFO_TEMPLATE = "\n".join([
+    "## 基本情報\n\n",
+    "- **プロジェクトID**: {s.project_id}\n",
+    "- **プロジェクト名**: {s.project_name}\n",
+    "- **スラッグ**: {s.project_slug}\n",
+    "- **XP**: {s.xp}\n",
+    "- **作成日**: {creation_date}\n",
+    "- **ステータス**: {status}\n",
+    "- **最大人数**: {s.max_people}\n",
+    "- **ソロ**: {solo}\n",
+    "- **修正回数**: {s.correction_number}\n",
+    "- **利用可能**: {is_subscriptable}\n",
+])
+
+_CURSUS_INFO_TEMPLATE = "\n".join([
+    "\n## コース情報\n\n",
+    "- **コースID**: {s.cursus_id}\n",
+    "- **コース名**: {cursus_name}\n",
+    "- **コーススラッグ**: {cursus_slug}\n",
+])
+
+
 def project_session_to_object(session: ProjectSession) -> AnytypeObject:
     """ProjectSessionオブジェクトをAnytypeObjectに変換
 
@@ -78,7 +102,9 @@ def project_session_to_object(session: ProjectSession) -> AnytypeObject:
     Returns:
         Anytypeオブジェクト
     """
-    skill_names = extract_skill_names(session.skills)
+    # スキル・キーワードはボディとプロパティの両方で使うため、連結は1回だけ行う
+    skills_text = ", ".join(extract_skill_names(session.skills))
+    keywords_text = ", ".join(session.keywords)
     attachment_urls = extract_attachment_urls(session.attachments)
     rule_descriptions = format_rules(session.rules)
 
@@ -92,14 +118,15 @@ def project_session_to_object(session: ProjectSession) -> AnytypeObject:
     # ボディコンテンツをMarkdown形式で作成
     body = _build_markdown_body(
         session,
-        skill_names,
+        skills_text,
+        keywords_text,
         attachment_urls,
         rule_descriptions,
         success_rate_percent
     )
 
     # プロパティを設定
-    properties = _build_properties(session, skill_names)
+    properties = _build_properties(session, skills_text, keywords_text)
 
     # アイコンを設定(プロジェクト名の最初の文字を使用)
     icon = {
@@ -118,7 +145,8 @@ def project_session_to_object(session: ProjectSession) -> AnytypeObject:
 
 def _build_markdown_body(
     session: ProjectSession,
-    skill_names: List[str],
+    skills_text: str,
+    keywords_text: str,
     attachment_urls: List[str],
     rule_descriptions: List[str],
     success_rate_percent: str
@@ -127,7 +155,8 @@ def _build_markdown_body(
 
     Args:
         session: プロジェクトセッションオブジェクト
-        skill_names: スキル名のリスト
+        skills_text: スキル名をカンマ区切りで連結した文字列
+        keywords_text: キーワードをカンマ区切りで連結した文字列
         attachment_urls: 添付ファイルURLのリスト
         rule_descriptions: ルール説明のリスト
         success_rate_percent: 成功率のパーセンテージ文字列
@@ -140,33 +169,30 @@ def _build_markdown_body(
     if session.description:
         body_parts.append(f"## 説明\n\n{session.description}\n")
 
-    body_parts.append("## 基本情報\n\n")
-    body_parts.append(f"- **プロジェクトID**: {session.project_id}\n")
-    body_parts.append(f"- **プロジェクト名**: {session.project_name}\n")
-    body_parts.append(f"- **スラッグ**: {session.project_slug}\n")
-    body_parts.append(f"- **XP**: {session.xp}\n")
-    body_parts.append(f"- **作成日**: {session.creation_date or 'N/A'}\n")
-    body_parts.append(f"- **ステータス**: {session.status or 'N/A'}\n")
-    body_parts.append(f"- **最大人数**: {session.max_people}\n")
-    body_parts.append(f"- **ソロ**: {'はい' if session.solo else 'いいえ'}\n")
-    body_parts.append(f"- **修正回数**: {session.correction_number}\n")
-    body_parts.append(f"- **利用可能**: {'はい' if session.is_subscriptable else 'いいえ'}\n")
+    body_parts.append(_BASIC_INFO_TEMPLATE.format(
+        s=session,
+        creation_date=session.creation_date or "N/A",
+        status=session.status or "N/A",
+        solo="はい" if session.solo else "いいえ",
+        is_subscriptable="はい" if session.is_subscriptable else "いいえ",
+    ))
 
     if session.begin_at:
         body_parts.append(f"- **開始日**: {session.begin_at}\n")
     if session.end_at:
         body_parts.append(f"- **終了日**: {session.end_at}\n")
 
-    body_parts.append("\n## コース情報\n\n")
-    body_parts.append(f"- **コースID**: {session.cursus_id}\n")
-    body_parts.append(f"- **コース名**: {session.cursus_name or 'N/A'}\n")
-    body_parts.append(f"- **コーススラッグ**: {session.cursus_slug or 'N/A'}\n")
+    body_parts.append(_CURSUS_INFO_TEMPLATE.format(
+        s=session,
+        cursus_name=session.cursus_name or "N/A",
+        cursus_slug=session.cursus_slug or "N/A",
+    ))
 
     if session.keywords:
-        body_parts.append(f"\n## キーワード\n\n{', '.join(session.keywords)}\n")
+        body_parts.append(f"\n## キーワード\n\n{keywords_text}\n")
 
-    if skill_names:
-        body_parts.append(f"\n## スキル\n\n{', '.join(skill_names)}\n")
+    if skills_text:
+        body_parts.append(f"\n## スキル\n\n{skills_text}\n")
 
     if attachment_urls:
         body_parts.append(f"\n## 添付ファイル ({len(attachment_urls)}件)\n\n")
@@ -197,12 +223,13 @@ def _build_markdown_body(
     return "\n".join(body_parts)
 
 
-def _build_properties(session: ProjectSession, skill_names: List[str]) -> List[Dict[str, Any]]:
+def _build_properties(session: ProjectSession, skills_text: str, keywords_text: str) -> List[Dict[str, Any]]:
     """Anytypeオブジェクトのプロパティリストを構築
 
     Args:
         session: プロジェクトセッションオブジェクト
-        skill_names: スキル名のリスト
+        skills_text: スキル名をカンマ区切りで連結した文字列
+        keywords_text: キーワードをカンマ区切りで連結した文字列
 
     Returns:
         プロパティのリスト
@@ -278,16 +305,16 @@ def _build_properties(session: ProjectSession, skill_names: List[str]) -> List[D
             "text": session.end_at,
         })
 
-    if skill_names:
+    if skills_text:
         properties.append({
             "key": "skills",
-            "text": ", ".join(skill_names),
+            "text": skills_text,
         })
 
     if session.keywords:
         properties.append({
             "key": "keywords",
-            "text": ", ".join(session.keywords),
+            "text": keywords_text,
         })
 
     return properties
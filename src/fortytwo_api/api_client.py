@@ -4,8 +4,10 @@
 """
 import json
 import logging
+import time
+import orjson
 import requests
-from typing import Optional
+from typing import Any, Callable, Dict, NoReturn, Optional
 from src.exceptions import (
     ValidationError,
     NotFoundError,
@@ -17,6 +19,52 @@ from src.exceptions import (
 from auth42.exceptions import AuthenticationError as Auth42AuthenticationError, AuthorizationError as Auth42AuthorizationError
 
 
+def _raise_validation_error(response_text: str, error_message_prefix: str, resource_id: Optional[str]) -> NoReturn:
+    """400 Bad Request を ValidationError として送出"""
+    raise ValidationError(
+        f"{error_message_prefix}の形式が不正です。パラメータを確認してください",
+        response_text=response_text
+    )
+
+
+def _raise_authentication_error(response_text: str, error_message_prefix: str, resource_id: Optional[str]) -> NoReturn:
+    """401 Unauthorized を AuthenticationError として送出"""
+    raise Auth42AuthenticationError(
+        "認証に失敗しました。トークンが無効です。再認証を試みてください。",
+        status_code=401
+    )
+
+
+def _raise_authorization_error(response_text: str, error_message_prefix: str, resource_id: Optional[str]) -> NoReturn:
+    """403 Forbidden を AuthorizationError として送出"""
+    raise Auth42AuthorizationError(
+        "アクセスが拒否されました。必要なロールやスコープが不足している可能性があります。",
+        status_code=403
+    )
+
+
+def _raise_not_found_error(response_text: str, error_message_prefix: str, resource_id: Optional[str]) -> NoReturn:
+    """404 Not Found を NotFoundError として送出"""
+    raise NotFoundError(
+        "リソースが見つかりませんでした",
+        resource_id=resource_id,
+        response_text=response_text
+    )
+
+
+# 例外やログに含めるエラーレスポンスボディの最大バイト数
+_ERROR_BODY_LIMIT = 2048
+
+
+# ステータスコードごとの例外送出関数(該当しないエラーは APIError として扱う)
+_STATUS_ERROR_HANDLERS: Dict[int, Callable[[str, str, Optional[str]], NoReturn]] = {
+    400: _raise_validation_error,
+    401: _raise_authentication_error,
+    403: _raise_authorization_error,
+    404: _raise_not_found_error,
+}
+
+
 class APIResponseHandler:
     """APIレスポンスのエラーハンドリング共通処理クラス"""
 
@@ -42,39 +90,45 @@ class APIResponseHandler:
             NotFoundError: 404エラーの場合
             APIError: その他のエラーの場合
         """
+        if response.ok:
+            return
+
+        # 巨大なエラーページ全体をデコードしないよう、先頭部分のみを文字列化する
+        response_text = response.content[:_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
         # デバッグ用にresponse_textをログに記録（機密情報が含まれる可能性があるためDEBUGレベル）
-        if logger and not response.ok and response.text:
+        if logger and response_text:
             logger.debug(
-                f"APIエラーレスポンス (HTTP {response.status_code}): {response.text[:500]}"
+                "APIエラーレスポンス (HTTP %s): %s", response.status_code, response_text[:500]
             )
 
-        if response.status_code == 400:
-            raise ValidationError(
-                f"{error_message_prefix}の形式が不正です。パラメータを確認してください",
-                response_text=response.text
-            )
-        elif response.status_code == 401:
-            raise Auth42AuthenticationError(
-                "認証に失敗しました。トークンが無効です。再認証を試みてください。",
-                status_code=401
-            )
-        elif response.status_code == 403:
-            raise Auth42AuthorizationError(
-                "アクセスが拒否されました。必要なロールやスコープが不足している可能性があります。",
-                status_code=403
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(
-                "リソースが見つかりませんでした",
-                resource_id=resource_id,
-                response_text=response.text
-            )
-        elif not response.ok:
-            raise APIError(
-                f"{error_message_prefix}に失敗しました (HTTP {response.status_code})",
-                status_code=response.status_code,
-                response_text=response.text
-            )
+        handler = _STATUS_ERROR_HANDLERS.get(response.status_code)
+        if handler:
+            handler(response_text, error_message_prefix, resource_id)
+
+        raise APIError(
+            f"{error_message_prefix}に失敗しました (HTTP {response.status_code})",
+            status_code=response.status_code,
+            response_text=response_text
+        )
+
+    @staticmethod
+    def parse_json(response: requests.Response) -> Any:
+        """レスポンスボディをJSONとしてデコード
+
+        42 APIのレスポンスは常にUTF-8のJSONのため、response.json() の文字コード推定を
+        経由せずにバイト列を直接デコードします。
+
+        Args:
+            response: HTTPレスポンス
+
+        Returns:
+            デコードされたJSONデータ
+
+        Raises:
+            orjson.JSONDecodeError: JSONの解析に失敗した場合(json.JSONDecodeErrorのサブクラス)
+        """
+        return orjson.loads(response.content)
 
     @staticmethod
     def handle_request_exceptions(e: Exception) -> None:
@@ -98,6 +152,7 @@ class APIResponseHandler:
                 "リクエスト中にエラーが発生しました",
                 original_error=e
             ) from e
+        # orjson.JSONDecodeError は json.JSONDecodeError のサブクラスのため、ここで変換される
         elif isinstance(e, (json.JSONDecodeError, KeyError, TypeError)):
             raise ParseError(
                 "レスポンスの解析に失敗しました",
@@ -105,3 +160,41 @@ class APIResponseHandler:
             ) from e
         else:
             raise
+
+
+class AuthHeaderCache:
+    """認証ヘッダーを短時間キャッシュするクラス
+
+    セッション詳細の取得などで多数のリクエストを送る際に、
+    リクエストごとに auth.get_headers() を呼び出さないようにします。
+    """
+
+    def __init__(self, auth: Any, ttl: float = 60.0):
+        """認証ヘッダーキャッシュの初期化
+
+        Args:
+            auth: 42認証オブジェクト(get_headers() を持つもの)
+            ttl: ヘッダーを再利用する期間(秒)
+        """
+        self.auth = auth
+        self.ttl = ttl
+        self._headers: Optional[Dict[str, str]] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Dict[str, str]:
+        """認証ヘッダーを取得(期限切れの場合は再取得)
+
+        Returns:
+            リクエストヘッダー(呼び出し側で変更しないこと)
+        """
+        now = time.monotonic()
+        headers = self._headers
+        if headers is None or now >= self._expires_at:
+            headers = self.auth.get_headers()
+            self._headers = headers
+            self._expires_at = now + self.ttl
+        return headers
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄(次回の get() で再取得する)"""
+        self._headers = None
@@ -2,7 +2,12 @@
 
 42のAPIからプロジェクト情報を取得します。
 """
-from typing import List, Optional
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 import logging
 
 from auth42 import Auth42
@@ -14,16 +19,108 @@ from src.exceptions import (
     NotFoundError,
 )
 from src.payloads import Project, ProjectSession
+from src.cache import TTLCache
 from src.rate_limiter import RateLimiter
 from src.http_client import HTTPClient
-from .api_client import APIResponseHandler
+from .api_client import APIResponseHandler, AuthHeaderCache
 from .session_details import SessionDetailsFetcher
 
+T = TypeVar("T")
+
+# APIResponseHandler が送出する例外(そのまま呼び出し元へ再送出する)
+_PASS_THROUGH_ERRORS = (ValidationError, AuthenticationError, AuthorizationError, NotFoundError, APIError)
+
+# クエリパラメータ用の真偽値表現
+_BOOL_STR = {True: "true", False: "false"}
+
+
+def _http_boundary(func: Callable[..., T]) -> Callable[..., T]:
+    """APIリクエストの例外を共通の例外クラスに変換するデコレーター
+
+    APIResponseHandler が送出した例外はそのまま再送出し、それ以外の例外
+    (通信エラー、パースエラーなど)は handle_request_exceptions で変換します。
+    認証エラー(401)の場合は、次回のリクエストで認証ヘッダーを取り直すようにキャッシュを破棄します。
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except AuthenticationError:
+            self._auth_headers.invalidate()
+            raise
+        except _PASS_THROUGH_ERRORS:
+            raise
+        except Exception as e:
+            APIResponseHandler.handle_request_exceptions(e)
+    return wrapper
+
+
+def _header_int(response, name: str) -> Optional[int]:
+    """レスポンスヘッダーの値を整数として取得
+
+    Args:
+        response: HTTPレスポンス
+        name: ヘッダー名(例: "X-Total")
+
+    Returns:
+        ヘッダーの整数値(存在しない、または整数でない場合はNone)
+    """
+    try:
+        return int(response.headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _copy_project(project: Project) -> Project:
+    """キャッシュ済みのプロジェクトを呼び出し元に返すためのコピーを作成
+
+    リストのフィールドのみ新しいリストにし、要素(文字列・添付ファイルの辞書)は共有します。
+
+    Args:
+        project: コピー元のプロジェクト
+
+    Returns:
+        コピーしたプロジェクト
+    """
+    return replace(
+        project,
+        objectives=list(project.objectives),
+        attachments=list(project.attachments),
+        tags=list(project.tags),
+    )
+
+
+def _filter_params(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """フィルター条件をクエリパラメータ形式(filter[key])に変換
+
+    真偽値はAPIが受け付ける "true" / "false" に変換します。
+
+    Args:
+        filters: フィルター条件(キーが "filter[" で始まる場合はそのまま使用)
+
+    Returns:
+        クエリパラメータの辞書
+    """
+    return {
+        (key if key.startswith("filter[") else f"filter[{key}]"): (
+            _BOOL_STR[value] if isinstance(value, bool) else value
+        )
+        for key, value in filters.items()
+    }
+
 
 class Project42:
     """42プロジェクト取得クラス"""
 
     BASE_URL = "https://api.intra.42.fr"
+    # エンドポイントURL(呼び出しごとに組み立てないようクラス定義時に確定させる)
+    PROJECTS_URL = BASE_URL + "/v2/projects"
+    PROJECT_URL_TEMPLATE = BASE_URL + "/v2/projects/%s"
+    PROJECT_SESSIONS_URL = BASE_URL + "/v2/project_sessions"
+    PROJECT_CACHE_TTL = 3600.0  # プロジェクト情報のキャッシュ有効期間(秒)
+    PROJECT_VALIDATOR_TTL = 24 * 3600.0  # 条件付きGET用のETagを保持する期間(秒)
+    AUTH_HEADERS_TTL = 60.0  # 認証ヘッダーを再利用する期間(秒)
+    PAGE_WINDOW = 4  # 一覧の全件取得で同時に取得(先読み)するページ数
 
     def __init__(self, auth: Auth42, logger: Optional[logging.Logger] = None, config: Optional[Config] = None):
         """プロジェクト取得クラスの初期化
@@ -42,11 +139,14 @@ class Project42:
         rate_limit_threshold = config.rate_limit_threshold if config else 10
         base_delay = config.base_delay if config else 0.5
         max_delay = config.max_delay if config else 60.0
+        pool_maxsize = config.http_pool_maxsize if config else 16
+        requests_per_second = config.requests_per_second if config else 2.0
 
         # レート制限管理とHTTPクライアントを初期化
         self.rate_limiter = RateLimiter(
             threshold=rate_limit_threshold,
             base_delay=base_delay,
+            requests_per_second=requests_per_second,
             logger=self.logger
         )
         self.http_client = HTTPClient(
@@ -54,16 +154,37 @@ class Project42:
             max_retries=max_retries,
             base_delay=base_delay,
             max_delay=max_delay,
-            logger=self.logger
+            logger=self.logger,
+            pool_maxsize=pool_maxsize,
         )
 
+        # プロジェクト情報のキャッシュ(プロジェクトのメタデータは滅多に変わらないため)
+        self._project_cache: TTLCache = TTLCache(maxsize=1024, ttl=self.PROJECT_CACHE_TTL)
+        # キャッシュ期限切れ後も (ETag, プロジェクト) を保持し、条件付きGETで再検証する
+        self._project_validators: TTLCache = TTLCache(maxsize=1024, ttl=self.PROJECT_VALIDATOR_TTL)
+
+        # 認証ヘッダー(詳細取得クラスと共有する)
+        self._auth_headers = AuthHeaderCache(self.auth, ttl=self.AUTH_HEADERS_TTL)
+
         # セッション詳細取得クラスを初期化
         self.session_details_fetcher = SessionDetailsFetcher(
             auth=self.auth,
+            auth_headers=self._auth_headers,
             http_client=self.http_client,
             logger=self.logger
         )
 
+    def close(self) -> None:
+        """HTTPクライアントのコネクションを解放"""
+        self.http_client.close()
+
+    def __enter__(self) -> "Project42":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @_http_boundary
     def get_projects(
         self,
         campus_id: Optional[int] = None,
@@ -84,11 +205,108 @@ class Project42:
         Returns:
             プロジェクトのリスト
         """
-        url = f"{self.BASE_URL}/v2/projects"
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
+        base_params = self._build_project_params(campus_id, cursus_id, per_page, kwargs)
+        projects, _, _ = self._fetch_projects_page(base_params, page)
+        return projects
+
+    @_http_boundary
+    def get_projects_projected(
+        self,
+        fields: Tuple[str, ...],
+        campus_id: Optional[int] = None,
+        cursus_id: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 100,
+        **kwargs
+    ) -> List[Tuple[Any, ...]]:
+        """プロジェクト一覧を指定フィールドのタプルとして取得
+
+        Projectオブジェクトを生成せず、APIレスポンスから必要なフィールドだけを取り出します。
+        slugとIDの対応表を作る場合など、一部のフィールドしか使わない場合に使用します。
+
+        Args:
+            fields: 取り出すAPIレスポンスのキー(例: ("slug", "id"))
+            campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
+            cursus_id: カリキュラムID(オプション、デフォルト: 21 (42cursus))
+            page: ページ番号
+            per_page: 1ページあたりの項目数
+            **kwargs: その他のフィルター条件
+
+        Returns:
+            fields の順に値を並べたタプルのリスト(キーが無い場合はNone)
+
+        Note:
+            値はAPIレスポンスのまま返すため、"tags" などはProjectとは異なり辞書のリストになります。
+        """
+        base_params = self._build_project_params(campus_id, cursus_id, per_page, kwargs)
+        projects_data, _, _ = self._request_projects(base_params, page)
+        return [tuple(map(project.get, fields)) for project in projects_data]
+
+    @_http_boundary
+    def get_projects_as_dicts(
+        self,
+        campus_id: Optional[int] = None,
+        cursus_id: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 100,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """プロジェクト一覧を Project.to_dict() と同じ形式の辞書として取得
+
+        Projectオブジェクトを生成せずに辞書を返すため、to_dict() の結果しか
+        使わない場合に使用します。
+
+        Args:
+            campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
+            cursus_id: カリキュラムID(オプション、デフォルト: 21 (42cursus))
+            page: ページ番号
+            per_page: 1ページあたりの項目数
+            **kwargs: その他のフィルター条件
+
+        Returns:
+            プロジェクト情報の辞書のリスト
+        """
+        base_params = self._build_project_params(campus_id, cursus_id, per_page, kwargs)
+        projects_data, _, _ = self._request_projects(base_params, page)
+        return list(map(Project.dict_from_api_response, projects_data))
+
+    @_http_boundary
+    def _fetch_projects_page(
+        self,
+        base_params: Dict[str, Any],
+        page: int,
+    ) -> Tuple[List[Project], Optional[int], int]:
+        """プロジェクト一覧の1ページを取得し、ページ情報と共に返す
+
+        Args:
+            base_params: ページ番号以外のクエリパラメータ(_build_project_params を参照)
+            page: ページ番号
+
+        Returns:
+            (プロジェクトのリスト, 総件数, 1ページあたりの項目数) のタプル(_request_projects を参照)
+        """
+        projects_data, total, page_size = self._request_projects(base_params, page)
+        return list(map(Project.from_api_response, projects_data)), total, page_size
+
+    @staticmethod
+    def _build_project_params(
+        campus_id: Optional[int],
+        cursus_id: Optional[int],
+        per_page: int,
+        filters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """プロジェクト一覧APIのクエリパラメータ(ページ番号以外)を組み立てる
+
+        Args:
+            campus_id: キャンパスID
+            cursus_id: カリキュラムID
+            per_page: 1ページあたりの項目数
+            filters: その他のフィルター条件
+
+        Returns:
+            クエリパラメータの辞書(呼び出し側で変更しないこと)
+        """
+        params = {"per_page": per_page}
 
         if campus_id:
             params["filter[campus_id]"] = campus_id
@@ -96,24 +314,34 @@ class Project42:
             params["filter[cursus_id]"] = cursus_id
 
         # その他のフィルター条件を追加
-        for key, value in kwargs.items():
-            if key.startswith("filter["):
-                params[key] = value
-            else:
-                params[f"filter[{key}]"] = value
+        params.update(_filter_params(filters))
+        return params
 
-        headers = self.auth.get_headers()
+    def _request_projects(
+        self,
+        base_params: Dict[str, Any],
+        page: int,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """プロジェクト一覧APIを呼び出し、デコード済みのレスポンスをページ情報と共に返す
 
-        try:
-            response = self.http_client.request("GET", url, headers=headers, params=params)
-            APIResponseHandler.handle_response(response, error_message_prefix="プロジェクト取得", logger=self.logger)
-            projects_data = response.json()
-            return [Project.from_api_response(project) for project in projects_data]
-        except (ValidationError, AuthenticationError, AuthorizationError, NotFoundError, APIError):
-            raise
-        except Exception as e:
-            APIResponseHandler.handle_request_exceptions(e)
+        Args:
+            base_params: ページ番号以外のクエリパラメータ(_build_project_params を参照)
+            page: ページ番号
+
+        Returns:
+            (プロジェクト情報の辞書のリスト, 総件数(X-Total、無い場合はNone), 1ページあたりの項目数)
+            のタプル。1ページあたりの項目数はX-Per-Pageヘッダーがあればその値を使用します。
+        """
+        # 複数ページを並列に取得するため、共通パラメータは変更せずにコピーしてページ番号を加える
+        params = {**base_params, "page": page}
+        headers = self._auth_headers.get()
+
+        response = self.http_client.request("GET", self.PROJECTS_URL, headers=headers, params=params)
+        APIResponseHandler.handle_response(response, error_message_prefix="プロジェクト取得", logger=self.logger)
+        projects_data = APIResponseHandler.parse_json(response)
+        return projects_data, _header_int(response, "X-Total"), _header_int(response, "X-Per-Page") or base_params["per_page"]
 
+    @_http_boundary
     def get_project_by_id(self, project_id: int) -> Project:
         """プロジェクトIDでプロジェクトを取得
 
@@ -122,25 +350,14 @@ class Project42:
 
         Returns:
             プロジェクトオブジェクト
-        """
-        url = f"{self.BASE_URL}/v2/projects/{project_id}"
-        headers = self.auth.get_headers()
 
-        try:
-            response = self.http_client.request("GET", url, headers=headers)
-            APIResponseHandler.handle_response(
-                response,
-                error_message_prefix="プロジェクト取得",
-                resource_id=str(project_id),
-                logger=self.logger
-            )
-            project_data = response.json()
-            return Project.from_api_response(project_data)
-        except (ValidationError, AuthenticationError, AuthorizationError, NotFoundError, APIError):
-            raise
-        except Exception as e:
-            APIResponseHandler.handle_request_exceptions(e)
+        Note:
+            取得結果は PROJECT_CACHE_TTL 秒間キャッシュされます(エラーはキャッシュしません)。
+            期限切れ後はETagによる条件付きGETで再検証します。
+        """
+        return self._get_project(("id", project_id), str(project_id))
 
+    @_http_boundary
     def get_project_by_slug(self, slug: str) -> Project:
         """プロジェクトスラッグでプロジェクトを取得
 
@@ -149,73 +366,188 @@ class Project42:
 
         Returns:
             プロジェクトオブジェクト
+
+        Note:
+            取得結果は PROJECT_CACHE_TTL 秒間キャッシュされます(エラーはキャッシュしません)。
+            期限切れ後はETagによる条件付きGETで再検証します。
         """
-        url = f"{self.BASE_URL}/v2/projects/{slug}"
-        headers = self.auth.get_headers()
+        return self._get_project(("slug", slug), slug)
 
-        try:
-            response = self.http_client.request("GET", url, headers=headers)
+    def _get_project(self, cache_key: Tuple[str, Any], resource_id: str) -> Project:
+        """プロジェクトIDまたはスラッグでプロジェクトを取得(キャッシュ付き)
+
+        Args:
+            cache_key: キャッシュキー(("id", プロジェクトID) または ("slug", スラッグ))
+            resource_id: URLとエラーメッセージに使用するIDまたはスラッグ
+
+        Returns:
+            プロジェクトオブジェクト(呼び出しごとに新しいオブジェクト)
+
+        Note:
+            キャッシュ済みのオブジェクトは呼び出し元で変更されてもキャッシュが壊れないよう、
+            コピーを返します(リストは複製しますが、添付ファイルの辞書は共有するため変更しないこと)。
+        """
+        cached = self._project_cache.get(cache_key)
+        if cached is not None:
+            return _copy_project(cached)
+
+        url = self.PROJECT_URL_TEMPLATE % resource_id
+        headers = self._auth_headers.get()
+
+        # 以前のETagがあれば If-None-Match を付けて送信し、変更が無ければ本文の再取得を省略する
+        validator = self._project_validators.get(url)
+        if validator is not None:
+            headers = {**headers, "If-None-Match": validator[0]}
+
+        response = self.http_client.request("GET", url, headers=headers)
+        if response.status_code == 304 and validator is not None:
+            project = validator[1]
+        else:
             APIResponseHandler.handle_response(
                 response,
                 error_message_prefix="プロジェクト取得",
-                resource_id=slug,
+                resource_id=resource_id,
                 logger=self.logger
             )
-            project_data = response.json()
-            return Project.from_api_response(project_data)
-        except (ValidationError, AuthenticationError, AuthorizationError, NotFoundError, APIError):
-            raise
-        except Exception as e:
-            APIResponseHandler.handle_request_exceptions(e)
+            project_data = APIResponseHandler.parse_json(response)
+            project = Project.from_api_response(project_data)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._project_validators.set(url, (etag, project))
+        # IDとスラッグのどちらで再検索されても同じ結果を返せるよう両方のキーで保存する
+        self._project_cache.set(("id", project.id), project)
+        self._project_cache.set(("slug", project.slug), project)
+        self._project_cache.set(cache_key, project)
+        return _copy_project(project)
 
     def get_all_projects(
         self,
         campus_id: Optional[int] = None,
         cursus_id: Optional[int] = None,
+        page_window: int = PAGE_WINDOW,
         **kwargs
     ) -> List[Project]:
         """全プロジェクトを取得(ページネーション対応)
 
+        page_window ページずつ並列に取得します(iter_all_projects を参照)。
+
         Args:
             campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
             cursus_id: カリキュラムID(オプション、デフォルト: 21 (42cursus))
+            page_window: 同時に取得するページ数(1の場合も次のページを1件先読みする)
             **kwargs: その他のフィルター条件
 
         Returns:
             全プロジェクトのリスト
         """
-        all_projects = []
-        page = 1
-        per_page = 100
-
-        while True:
-            projects = self.get_projects(
-                campus_id=campus_id,
-                cursus_id=cursus_id,
-                page=page,
-                per_page=per_page,
-                **kwargs
-            )
+        return list(self.iter_all_projects(
+            campus_id=campus_id,
+            cursus_id=cursus_id,
+            page_window=page_window,
+            **kwargs
+        ))
+
+    def iter_all_projects(
+        self,
+        campus_id: Optional[int] = None,
+        cursus_id: Optional[int] = None,
+        page_window: int = PAGE_WINDOW,
+        **kwargs
+    ) -> Iterator[Project]:
+        """全プロジェクトを1件ずつ返すイテレーター(ページネーション対応)
 
-            if not projects:
-                break
+        ページを取得するたびにプロジェクトを返すため、全件をメモリに保持せずに
+        処理できます。途中でイテレーションを打ち切った場合、その時点で先読み中の
+        ページ(最大 page_window ページ)を除き、以降のページは取得しません
+        (送信済みのリクエストは完了を待ってから戻ります)。
 
-            all_projects.extend(projects)
+        Args:
+            campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
+            cursus_id: カリキュラムID(オプション、デフォルト: 21 (42cursus))
+            page_window: 同時に取得するページ数(1の場合も次のページを1件先読みする)
+            **kwargs: その他のフィルター条件
 
-            # レスポンスがper_page未満なら最後のページ
-            if len(projects) < per_page:
-                break
+        Yields:
+            プロジェクトオブジェクト
+        """
+        # ページ番号以外のクエリパラメータは全ページで共通のため1回だけ組み立てる
+        base_params = self._build_project_params(campus_id, cursus_id, 100, kwargs)
+        yield from self._iter_all_pages(
+            lambda page: self._fetch_projects_page(base_params, page),
+            page_window=page_window,
+        )
+
+    @staticmethod
+    def _iter_all_pages(
+        fetch_page: Callable[[int], Tuple[List[T], Optional[int], int]],
+        page_window: int,
+    ) -> Iterator[T]:
+        """全ページの項目を順に返す(ページを page_window 件ずつ先読みして並列に取得)
+
+        常に後続の page_window ページを取得中の状態に保ち、呼び出し元が現在のページを
+        処理している間に次のページのリクエストを進めます。最初のページのX-Totalヘッダーから
+        総ページ数が分かる場合は最後のページまでを取得し、ヘッダーが無い場合は
+        1ページあたりの項目数未満のページが現れた時点で最後のページとみなして終了します
+        (この場合は存在しないページを要求しないよう、先読みは1ページずつ行います)。
+        ジェネレーターを途中で閉じた場合は、未送信のリクエストを取り消し、
+        送信済みのリクエストの完了を待ってから戻ります。
+
+        Args:
+            fetch_page: ページ番号を受け取り、(項目リスト, 総件数, 1ページあたりの項目数) を返す関数
+            page_window: 同時に取得するページ数
+
+        Yields:
+            各ページの項目(ページ番号順)
+        """
+        page_window = max(1, page_window)
 
-            page += 1
+        first_items, total, page_size = fetch_page(1)
 
-        return all_projects
+        # 最初のページがpage_size未満ならそれで全件
+        if len(first_items) < page_size:
+            yield from first_items
+            return
 
+        if total is not None:
+            # 総件数が分かっているので、最後のページまでを取得する
+            pages = iter(range(2, -(-total // page_size) + 1))
+        else:
+            # X-Totalヘッダーが無い場合は短いページが現れるまで1ページずつ先読みする
+            # (複数ページを先読みすると、最後のページ以降への不要なリクエストが発生するため)
+            pages = itertools.count(2)
+            page_window = 1
+
+        executor = ThreadPoolExecutor(max_workers=page_window)
+        try:
+            pending = deque(executor.submit(fetch_page, page) for page in itertools.islice(pages, page_window))
+            yield from first_items
+
+            while pending:
+                items, _, _ = pending.popleft().result()
+
+                # X-Totalヘッダーが無い場合は、page_size未満のページを最後のページとみなす
+                if total is None and len(items) < page_size:
+                    yield from items
+                    return
+
+                # 現在のページを返す前に次のページのリクエストを開始しておく
+                for page in itertools.islice(pages, 1):
+                    pending.append(executor.submit(fetch_page, page))
+                yield from items
+        finally:
+            # 途中で打ち切られた場合は、未送信のリクエストを取り消して送信済みのものの完了を待つ
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @_http_boundary
     def get_project_sessions(
         self,
         campus_id: Optional[int] = None,
         is_subscriptable: Optional[bool] = True,
         page: int = 1,
         per_page: int = 100,
+        status: Optional[str] = None,
+        solo: Optional[bool] = None,
+        cursus_id: Optional[int] = None,
         **kwargs
     ) -> List[ProjectSession]:
         """プロジェクトセッション一覧を取得
@@ -227,88 +559,226 @@ class Project42:
             is_subscriptable: 利用可能なプロジェクトのみを取得するか(デフォルト: True)
             page: ページ番号
             per_page: 1ページあたりの項目数
-            **kwargs: その他のフィルター条件
+            status: 進行ステータスで絞り込む(例: "in_progress"、Noneの場合は絞り込まない)
+            solo: 個人プロジェクトかどうかで絞り込む(Noneの場合は絞り込まない)
+            cursus_id: カリキュラムIDで絞り込む(Noneの場合は絞り込まない)
+            **kwargs: その他のフィルター条件(サーバー側で絞り込まれます)
 
         Returns:
             プロジェクトセッションのリスト
         """
-        url = f"{self.BASE_URL}/v2/project_sessions"
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
+        base_params = self._build_project_session_params(
+            campus_id, is_subscriptable, per_page, kwargs, status=status, solo=solo, cursus_id=cursus_id
+        )
+        sessions, _, _ = self._fetch_project_sessions_page(base_params, page)
+        return sessions
+
+    @_http_boundary
+    def get_project_sessions_as_dicts(
+        self,
+        campus_id: Optional[int] = None,
+        is_subscriptable: Optional[bool] = True,
+        page: int = 1,
+        per_page: int = 100,
+        status: Optional[str] = None,
+        solo: Optional[bool] = None,
+        cursus_id: Optional[int] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """プロジェクトセッション一覧を ProjectSession.to_dict() と同じ形式の辞書として取得
+
+        ProjectSessionオブジェクトを生成せずに辞書を返すため、to_dict() の結果しか
+        使わない場合に使用します。
+
+        Args:
+            campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
+            is_subscriptable: 利用可能なプロジェクトのみを取得するか(デフォルト: True)
+            page: ページ番号
+            per_page: 1ページあたりの項目数
+            status: 進行ステータスで絞り込む(例: "in_progress"、Noneの場合は絞り込まない)
+            solo: 個人プロジェクトかどうかで絞り込む(Noneの場合は絞り込まない)
+            cursus_id: カリキュラムIDで絞り込む(Noneの場合は絞り込まない)
+            **kwargs: その他のフィルター条件(サーバー側で絞り込まれます)
+
+        Returns:
+            プロジェクトセッション情報の辞書のリスト
+        """
+        base_params = self._build_project_session_params(
+            campus_id, is_subscriptable, per_page, kwargs, status=status, solo=solo, cursus_id=cursus_id
+        )
+        sessions_data, _, _ = self._request_project_sessions(base_params, page)
+        return list(map(ProjectSession.dict_from_api_response, sessions_data))
+
+    @_http_boundary
+    def _fetch_project_sessions_page(
+        self,
+        base_params: Dict[str, Any],
+        page: int,
+    ) -> Tuple[List[ProjectSession], Optional[int], int]:
+        """プロジェクトセッション一覧の1ページを取得し、ページ情報と共に返す
+
+        Args:
+            base_params: ページ番号以外のクエリパラメータ(_build_project_session_params を参照)
+            page: ページ番号
+
+        Returns:
+            (プロジェクトセッションのリスト, 総件数, 1ページあたりの項目数) のタプル
+            (_request_project_sessions を参照)
+        """
+        sessions_data, total, page_size = self._request_project_sessions(base_params, page)
+        return list(map(ProjectSession.from_api_response, sessions_data)), total, page_size
+
+    @staticmethod
+    def _build_project_session_params(
+        campus_id: Optional[int],
+        is_subscriptable: Optional[bool],
+        per_page: int,
+        filters: Dict[str, Any],
+        status: Optional[str] = None,
+        solo: Optional[bool] = None,
+        cursus_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """プロジェクトセッション一覧APIのクエリパラメータ(ページ番号以外)を組み立てる
+
+        Args:
+            campus_id: キャンパスID
+            is_subscriptable: 利用可能なプロジェクトのみを取得するか
+            per_page: 1ページあたりの項目数
+            filters: その他のフィルター条件
+            status: 進行ステータス(Noneの場合は絞り込まない)
+            solo: 個人プロジェクトかどうか(Noneの場合は絞り込まない)
+            cursus_id: カリキュラムID(Noneの場合は絞り込まない)
+
+        Returns:
+            クエリパラメータの辞書(呼び出し側で変更しないこと)
+        """
+        params = {"per_page": per_page}
 
         if campus_id:
             params["filter[campus_id]"] = campus_id
         if is_subscriptable is not None:
-            params["filter[is_subscriptable]"] = str(is_subscriptable).lower()
+            params["filter[is_subscriptable]"] = _BOOL_STR[is_subscriptable]
+        if status is not None:
+            params["filter[status]"] = status
+        if solo is not None:
+            params["filter[solo]"] = _BOOL_STR[solo]
+        if cursus_id is not None:
+            params["filter[cursus_id]"] = cursus_id
 
         # その他のフィルター条件を追加
-        for key, value in kwargs.items():
-            if key.startswith("filter["):
-                params[key] = value
-            else:
-                params[f"filter[{key}]"] = value
+        params.update(_filter_params(filters))
+        return params
 
-        headers = self.auth.get_headers()
+    def _request_project_sessions(
+        self,
+        base_params: Dict[str, Any],
+        page: int,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """プロジェクトセッション一覧APIを呼び出し、デコード済みのレスポンスをページ情報と共に返す
 
-        try:
-            response = self.http_client.request("GET", url, params=params, headers=headers)
-            APIResponseHandler.handle_response(response, error_message_prefix="プロジェクトセッション取得", logger=self.logger)
-            sessions_data = response.json()
-            return [ProjectSession.from_api_response(session) for session in sessions_data]
-        except (ValidationError, AuthenticationError, AuthorizationError, NotFoundError, APIError):
-            raise
-        except Exception as e:
-            APIResponseHandler.handle_request_exceptions(e)
+        Args:
+            base_params: ページ番号以外のクエリパラメータ(_build_project_session_params を参照)
+            page: ページ番号
+
+        Returns:
+            (プロジェクトセッション情報の辞書のリスト, 総件数(X-Total、無い場合はNone), 1ページあたりの項目数)
+            のタプル。1ページあたりの項目数はX-Per-Pageヘッダーがあればその値を使用します。
+        """
+        # 複数ページを並列に取得するため、共通パラメータは変更せずにコピーしてページ番号を加える
+        params = {**base_params, "page": page}
+        headers = self._auth_headers.get()
+
+        response = self.http_client.request("GET", self.PROJECT_SESSIONS_URL, params=params, headers=headers)
+        APIResponseHandler.handle_response(response, error_message_prefix="プロジェクトセッション取得", logger=self.logger)
+        sessions_data = APIResponseHandler.parse_json(response)
+        return sessions_data, _header_int(response, "X-Total"), _header_int(response, "X-Per-Page") or base_params["per_page"]
 
     def get_all_project_sessions(
         self,
         campus_id: Optional[int] = None,
         is_subscriptable: Optional[bool] = True,
+        page_window: int = PAGE_WINDOW,
+        status: Optional[str] = None,
+        solo: Optional[bool] = None,
+        cursus_id: Optional[int] = None,
         **kwargs
     ) -> List[ProjectSession]:
         """全プロジェクトセッションを取得(ページネーション対応)
 
+        page_window ページずつ並列に取得します(iter_all_project_sessions を参照)。
+
         Args:
             campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
             is_subscriptable: 利用可能なプロジェクトのみを取得するか(デフォルト: True)
-            **kwargs: その他のフィルター条件
+            page_window: 同時に取得するページ数(1の場合も次のページを1件先読みする)
+            status: 進行ステータスで絞り込む(例: "in_progress"、Noneの場合は絞り込まない)
+            solo: 個人プロジェクトかどうかで絞り込む(Noneの場合は絞り込まない)
+            cursus_id: カリキュラムIDで絞り込む(Noneの場合は絞り込まない)
+            **kwargs: その他のフィルター条件(サーバー側で絞り込まれます)
 
         Returns:
             全プロジェクトセッションのリスト
         """
-        all_sessions = []
-        page = 1
-        per_page = 100
-
-        self.logger.info(f"全プロジェクトセッション取得開始 (campus_id={campus_id}, is_subscriptable={is_subscriptable})")
-
-        while True:
-            self.logger.info(f"  ページ {page} を取得中...")
-            sessions = self.get_project_sessions(
-                campus_id=campus_id,
-                is_subscriptable=is_subscriptable,
-                page=page,
-                per_page=per_page,
-                **kwargs
-            )
+        self.logger.info("全プロジェクトセッション取得開始 (campus_id=%s, is_subscriptable=%s)", campus_id, is_subscriptable)
+
+        all_sessions = list(self.iter_all_project_sessions(
+            campus_id=campus_id,
+            is_subscriptable=is_subscriptable,
+            page_window=page_window,
+            status=status,
+            solo=solo,
+            cursus_id=cursus_id,
+            **kwargs
+        ))
+
+        self.logger.info("全プロジェクトセッション取得完了: 合計 %d件", len(all_sessions))
+        return all_sessions
 
-            if not sessions:
-                self.logger.info(f"  ページ {page}: データなし")
-                break
+    def iter_all_project_sessions(
+        self,
+        campus_id: Optional[int] = None,
+        is_subscriptable: Optional[bool] = True,
+        page_window: int = PAGE_WINDOW,
+        status: Optional[str] = None,
+        solo: Optional[bool] = None,
+        cursus_id: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[ProjectSession]:
+        """全プロジェクトセッションを1件ずつ返すイテレーター(ページネーション対応)
 
-            all_sessions.extend(sessions)
-            self.logger.info(f"  ページ {page}: {len(sessions)}件取得")
+        ページを取得するたびにセッションを返すため、全件をメモリに保持せずに
+        処理できます。途中でイテレーションを打ち切った場合、その時点で先読み中の
+        ページ(最大 page_window ページ)を除き、以降のページは取得しません
+        (送信済みのリクエストは完了を待ってから戻ります)。
 
-            # レスポンスがper_page未満なら最後のページ
-            if len(sessions) < per_page:
-                break
+        Args:
+            campus_id: キャンパスID(オプション、デフォルト: 26 (Tokyoキャンパス))
+            is_subscriptable: 利用可能なプロジェクトのみを取得するか(デフォルト: True)
+            page_window: 同時に取得するページ数(1の場合も次のページを1件先読みする)
+            status: 進行ステータスで絞り込む(例: "in_progress"、Noneの場合は絞り込まない)
+            solo: 個人プロジェクトかどうかで絞り込む(Noneの場合は絞り込まない)
+            cursus_id: カリキュラムIDで絞り込む(Noneの場合は絞り込まない)
+            **kwargs: その他のフィルター条件(サーバー側で絞り込まれます)
+
+        Yields:
+            プロジェクトセッションオブジェクト
+        """
+        # ページ番号以外のクエリパラメータは全ページで共通のため1回だけ組み立てる
+        base_params = self._build_project_session_params(
+            campus_id, is_subscriptable, 100, kwargs, status=status, solo=solo, cursus_id=cursus_id
+        )
 
-            page += 1
+        def fetch_page(page: int) -> Tuple[List[ProjectSession], Optional[int], int]:
+            self.logger.info("  ページ %d を取得中...", page)
+            result = self._fetch_project_sessions_page(base_params, page)
+            sessions = result[0]
+            if sessions:
+                self.logger.info("  ページ %d: %d件取得", page, len(sessions))
+            else:
+                self.logger.info("  ページ %d: データなし", page)
+            return result
 
-        self.logger.info(f"全プロジェクトセッション取得完了: 合計 {len(all_sessions)}件")
-        return all_sessions
+        yield from self._iter_all_pages(fetch_page, page_window=page_window)
 
     def get_project_session_with_details(self, session: ProjectSession) -> ProjectSession:
         """プロジェクトセッションの詳細情報(スキル、添付ファイル、ルール、チーム統計)を取得して更新
@@ -3,149 +3,340 @@
 42のプロジェクトセッションの詳細情報（スキル、添付ファイル、ルール、チーム統計など）を取得する処理を提供します。
 """
 import logging
-from typing import List, Dict, Any, Tuple
+import re
+import sys
+from concurrent.futures import Future
+from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple
 import requests
 
 from auth42 import Auth42
+from src.cache import TTLCache
 from src.http_client import HTTPClient
 from src.exceptions import Project42Error
 from src.payloads import ProjectSession
+from auth42.exceptions import AuthenticationError
+from .api_client import APIResponseHandler, AuthHeaderCache
+
+# 詳細情報の取得失敗として扱うエラー(通信エラーとJSONの解析エラー)
+# response.json() は解析失敗時にRequestExceptionのサブクラスを送出していたため、
+# APIResponseHandler.parse_json の送出するValueError(JSONDecodeError)も同様に扱う
+_DETAIL_FETCH_ERRORS = (requests.exceptions.RequestException, ValueError)
+
+# ルールをForbidden(禁止)/Recommended(推奨)に分類するキーワード
+_FORBIDDEN_RE = re.compile(r"forbidden|禁止|not allowed|not permitted", re.IGNORECASE)
+_RECOMMENDED_RE = re.compile(r"recommended|推奨|suggested|should", re.IGNORECASE)
 
 
 class SessionDetailsFetcher:
     """セッション詳細情報取得クラス"""
 
     BASE_URL = "https://api.intra.42.fr"
-
-    def __init__(self, auth: Auth42, http_client: HTTPClient, logger: logging.Logger):
+    # エンドポイントURL(呼び出しごとに組み立てないようクラス定義時に確定させる)
+    SESSION_SKILLS_URL_TEMPLATE = BASE_URL + "/v2/project_sessions/%s/project_sessions_skills"
+    SESSION_ATTACHMENTS_URL_TEMPLATE = BASE_URL + "/v2/project_sessions/%s/attachments"
+    SESSION_RULES_URL_TEMPLATE = BASE_URL + "/v2/project_sessions/%s/project_sessions_rules"
+    SESSION_TEAMS_URL_TEMPLATE = BASE_URL + "/v2/project_sessions/%s/teams"
+    SESSION_EVALUATIONS_URL_TEMPLATE = BASE_URL + "/v2/project_sessions/%s/evaluations"
+    RULE_PATH_TEMPLATE = "/v2/rules/%s"
+    SCALE_PATH_TEMPLATE = "/v2/scales/%s"
+    REFERENCE_CACHE_TTL = 6 * 3600.0  # ルール・スケール情報のキャッシュ有効期間(秒)
+    REFERENCE_VALIDATOR_TTL = 24 * 3600.0  # 条件付きGET用のETagを保持する期間(秒)
+    TEAM_STATS_CACHE_TTL = 60.0  # チーム統計情報のキャッシュ有効期間(秒)
+
+    def __init__(
+        self,
+        auth: Auth42,
+        http_client: HTTPClient,
+        logger: logging.Logger,
+        auth_headers: Optional[AuthHeaderCache] = None,
+    ):
         """セッション詳細取得クラスの初期化
 
         Args:
             auth: 42認証オブジェクト
             http_client: HTTPクライアント
             logger: ロガー
+            auth_headers: 認証ヘッダーキャッシュ(オプション、省略時は新規作成)
         """
         self.auth = auth
+        self._auth_headers = auth_headers or AuthHeaderCache(auth)
         self.http_client = http_client
         self.logger = logger
 
-    def get_project_session_skills(self, project_session_id: int) -> List[Dict[str, Any]]:
+        # ルール・スケールはセッション間で共通の参照データのため、取得結果をキャッシュする
+        self._reference_cache: TTLCache = TTLCache(maxsize=4096, ttl=self.REFERENCE_CACHE_TTL)
+        # キャッシュ期限切れ後も (ETag, レスポンス) を保持し、条件付きGETで再検証する
+        self._reference_validators: TTLCache = TTLCache(maxsize=4096, ttl=self.REFERENCE_VALIDATOR_TTL)
+        # 存在しない(404)参照データ(同じIDを何度も問い合わせないようにする)
+        self._reference_missing: TTLCache = TTLCache(maxsize=4096, ttl=self.REFERENCE_CACHE_TTL)
+        # 取得中の参照データ(同じパスへの同時リクエストを1回にまとめる)
+        self._reference_inflight: Dict[str, Future] = {}
+        self._reference_inflight_lock = Lock()
+
+        # チーム統計情報は短時間だけキャッシュし、取得失敗時は前回の値を返す
+        self._team_stats_cache: TTLCache = TTLCache(maxsize=4096, ttl=self.TEAM_STATS_CACHE_TTL)
+        self._team_stats_fallback: TTLCache = TTLCache(maxsize=4096, ttl=self.REFERENCE_CACHE_TTL)
+
+    def _raise_if_unauthorized(self, response: requests.Response) -> None:
+        """認証エラー(401)の場合は認証ヘッダーのキャッシュを破棄して AuthenticationError を送出
+
+        詳細情報の取得失敗は空の結果として扱いますが、401は認証ヘッダーが無効になったことを
+        示すため、空の結果を返したりキャッシュしたりせずに呼び出し元へ伝えます。
+
+        Args:
+            response: HTTPレスポンス
+
+        Raises:
+            AuthenticationError: 401エラーの場合
+        """
+        if response.status_code == 401:
+            self._auth_headers.invalidate()
+            APIResponseHandler.handle_response(
+                response, error_message_prefix="セッション詳細取得", logger=self.logger
+            )
+
+    def _get_reference(self, path: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """ルール・スケールなどの参照データを取得(キャッシュ・条件付きGET付き)
+
+        複数のセッションから同じルール・スケールを同時に要求された場合も、
+        APIへのリクエストは1回にまとめます。404となったパスも一定期間記録し、
+        再度問い合わせません。
+
+        Args:
+            path: BASE_URL以降のパス(例: "/v2/rules/1")
+            headers: リクエストヘッダー
+
+        Returns:
+            デコード済みのレスポンス
+
+        Raises:
+            AuthenticationError: 認証エラー(401)の場合
+            requests.exceptions.RequestException: 通信エラー、またはエラーレスポンスの場合
+            ValueError: JSONの解析に失敗した場合
+        """
+        cached = self._reference_cache.get(path)
+        if cached is not None:
+            return cached
+        if self._reference_missing.get(path):
+            raise requests.exceptions.HTTPError(f"404 Not Found (キャッシュ済み): {path}")
+
+        # 別スレッドが同じパスを取得中であれば、その結果を待って共有する
+        with self._reference_inflight_lock:
+            future = self._reference_inflight.get(path)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._reference_inflight[path] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            data = self._fetch_reference(path, headers)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._reference_inflight_lock:
+                del self._reference_inflight[path]
+
+    def _fetch_reference(self, path: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """参照データをAPIから取得してキャッシュに保存
+
+        Args:
+            path: BASE_URL以降のパス
+            headers: リクエストヘッダー
+
+        Returns:
+            デコード済みのレスポンス
+        """
+        # 以前のETagがあれば If-None-Match を付けて送信し、変更が無ければ本文の再取得を省略する
+        validator = self._reference_validators.get(path)
+        if validator is not None:
+            headers = {**headers, "If-None-Match": validator[0]}
+
+        response = self.http_client.request("GET", self.BASE_URL + path, headers=headers)
+        self._raise_if_unauthorized(response)
+        if response.status_code == 304 and validator is not None:
+            data = validator[1]
+        else:
+            if response.status_code == 404:
+                self._reference_missing.set(path, True)
+            response.raise_for_status()
+            data = APIResponseHandler.parse_json(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._reference_validators.set(path, (etag, data))
+
+        self._reference_cache.set(path, data)
+        return data
+
+    def get_project_session_skills(
+        self,
+        project_session_id: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
         """プロジェクトセッションのスキル情報を取得
 
         Args:
             project_session_id: プロジェクトセッションID
+            headers: リクエストヘッダー(省略時は認証情報から取得)
 
         Returns:
             スキル情報のリスト
         """
-        url = f"{self.BASE_URL}/v2/project_sessions/{project_session_id}/project_sessions_skills"
-        headers = self.auth.get_headers()
+        url = self.SESSION_SKILLS_URL_TEMPLATE % project_session_id
+        if headers is None:
+            headers = self._auth_headers.get()
 
         try:
             response = self.http_client.request("GET", url, headers=headers)
+            self._raise_if_unauthorized(response)
             response.raise_for_status()
-            return response.json()
+            return APIResponseHandler.parse_json(response)
         except Project42Error:
             # Project42Errorはそのまま再スロー
             raise
-        except requests.exceptions.RequestException as e:
+        except _DETAIL_FETCH_ERRORS as e:
             # エラー時は空リストを返す(ログに記録はしない)
-            self.logger.debug(f"スキル情報取得エラー (session_id={project_session_id}): {e}")
+            self.logger.debug("スキル情報取得エラー (session_id=%s): %s", project_session_id, e)
             return []
 
-    def get_project_session_attachments(self, project_session_id: int) -> List[Dict[str, Any]]:
+    def get_project_session_attachments(
+        self,
+        project_session_id: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
         """プロジェクトセッションの添付ファイル情報を取得
 
         Args:
             project_session_id: プロジェクトセッションID
+            headers: リクエストヘッダー(省略時は認証情報から取得)
 
         Returns:
             添付ファイル情報のリスト
         """
-        url = f"{self.BASE_URL}/v2/project_sessions/{project_session_id}/attachments"
-        headers = self.auth.get_headers()
+        url = self.SESSION_ATTACHMENTS_URL_TEMPLATE % project_session_id
+        if headers is None:
+            headers = self._auth_headers.get()
 
         try:
             response = self.http_client.request("GET", url, headers=headers)
+            self._raise_if_unauthorized(response)
             response.raise_for_status()
-            return response.json()
+            return APIResponseHandler.parse_json(response)
         except Project42Error:
             # Project42Errorはそのまま再スロー
             raise
-        except requests.exceptions.RequestException as e:
+        except _DETAIL_FETCH_ERRORS as e:
             # エラー時は空リストを返す(ログに記録はしない)
-            self.logger.debug(f"添付ファイル情報取得エラー (session_id={project_session_id}): {e}")
+            self.logger.debug("添付ファイル情報取得エラー (session_id=%s): %s", project_session_id, e)
             return []
 
-    def get_project_session_rules(self, project_session_id: int) -> List[Dict[str, Any]]:
+    def get_project_session_rules(
+        self,
+        project_session_id: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
         """プロジェクトセッションのルール情報を取得
 
         Args:
             project_session_id: プロジェクトセッションID
+            headers: リクエストヘッダー(省略時は認証情報から取得)
 
         Returns:
             ルール情報のリスト
         """
-        url = f"{self.BASE_URL}/v2/project_sessions/{project_session_id}/project_sessions_rules"
-        headers = self.auth.get_headers()
+        url = self.SESSION_RULES_URL_TEMPLATE % project_session_id
+        if headers is None:
+            headers = self._auth_headers.get()
 
         try:
             response = self.http_client.request("GET", url, headers=headers)
+            self._raise_if_unauthorized(response)
             response.raise_for_status()
-            rules_data = response.json()
-
-            # ルールの詳細情報を取得
-            detailed_rules = []
-            for rule_item in rules_data:
-                rule_id = rule_item.get("rule_id")
-                if rule_id:
-                    try:
-                        rule_url = f"{self.BASE_URL}/v2/rules/{rule_id}"
-                        rule_response = self.http_client.request("GET", rule_url, headers=headers)
-                        rule_response.raise_for_status()
-                        rule_detail = rule_response.json()
-                        detailed_rules.append({
-                            "rule_id": rule_id,
-                            "required": rule_item.get("required"),
-                            "kind": rule_detail.get("kind"),
-                            "name": rule_detail.get("name"),
-                            "description": rule_detail.get("description"),
-                        })
-                    except (Project42Error, requests.exceptions.RequestException) as e:
-                        # 詳細取得失敗時は基本情報のみ
-                        self.logger.debug(f"ルール詳細取得エラー (rule_id={rule_id}): {e}")
-                        detailed_rules.append({
-                            "rule_id": rule_id,
-                            "required": rule_item.get("required"),
-                        })
-
-            return detailed_rules
+            rules_data = APIResponseHandler.parse_json(response)
+
+            # ルールの詳細情報を取得(取得済みのルールはキャッシュから返す)
+            return [
+                self._get_rule_detail(rule_item, headers)
+                for rule_item in rules_data
+                if rule_item.get("rule_id")
+            ]
         except Project42Error:
             # Project42Errorはそのまま再スロー
             raise
-        except requests.exceptions.RequestException as e:
+        except _DETAIL_FETCH_ERRORS as e:
             # エラー時は空リストを返す(ログに記録はしない)
-            self.logger.debug(f"ルール情報取得エラー (session_id={project_session_id}): {e}")
+            self.logger.debug("ルール情報取得エラー (session_id=%s): %s", project_session_id, e)
             return []
 
-    def get_project_session_teams(self, project_session_id: int) -> Dict[str, Any]:
+    def _get_rule_detail(self, rule_item: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """ルールの詳細情報を取得
+
+        Args:
+            rule_item: project_sessions_rules のレスポンス項目
+            headers: リクエストヘッダー
+
+        Returns:
+            ルール情報の辞書(詳細取得失敗時は基本情報のみ)
+        """
+        rule_id = rule_item["rule_id"]
+        try:
+            rule_detail = self._get_reference(self.RULE_PATH_TEMPLATE % rule_id, headers)
+            return {
+                "rule_id": rule_id,
+                "required": rule_item.get("required"),
+                "kind": rule_detail.get("kind"),
+                "name": rule_detail.get("name"),
+                "description": rule_detail.get("description"),
+            }
+        except AuthenticationError:
+            raise
+        except (Project42Error, *_DETAIL_FETCH_ERRORS) as e:
+            # 詳細取得失敗時は基本情報のみ
+            self.logger.debug("ルール詳細取得エラー (rule_id=%s): %s", rule_id, e)
+            return {
+                "rule_id": rule_id,
+                "required": rule_item.get("required"),
+            }
+
+    def get_project_session_teams(
+        self,
+        project_session_id: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         """プロジェクトセッションのチーム統計情報を取得
 
         ガイドに基づいて、チームの成績(Success した割合など)を取得します。
-        ページネーションに対応し、全ページを走査してから集計します。
+        ページネーションに対応し、全ページを走査しながらページごとに集計します。
 
         Args:
             project_session_id: プロジェクトセッションID
+            headers: リクエストヘッダー(省略時は認証情報から取得)
 
         Returns:
             チーム統計情報の辞書(total_count, success_count, success_rate)
+
+        Note:
+            結果は TEAM_STATS_CACHE_TTL 秒間キャッシュされます。取得に失敗した場合、
+            以前に取得できた値があればそれを返します。
         """
-        url = f"{self.BASE_URL}/v2/project_sessions/{project_session_id}/teams"
-        headers = self.auth.get_headers()
+        cached = self._team_stats_cache.get(project_session_id)
+        if cached is not None:
+            return cached
+
+        url = self.SESSION_TEAMS_URL_TEMPLATE % project_session_id
+        if headers is None:
+            headers = self._auth_headers.get()
 
         try:
-            # 全ページを走査してチームデータを収集
-            all_teams_data = []
+            # 全ページを走査し、ページごとに集計する(全チームのリストは保持しない)
+            total_count = 0
+            success_count = 0
             page = 1
             per_page = 100
 
@@ -157,13 +348,20 @@ class SessionDetailsFetcher:
                     "per_page": per_page,
                 }
                 response = self.http_client.request("GET", url, headers=headers, params=params)
+                self._raise_if_unauthorized(response)
                 response.raise_for_status()
-                teams_data = response.json()
+                teams_data = APIResponseHandler.parse_json(response)
 
                 if not teams_data:
                     break
 
-                all_teams_data.extend(teams_data)
+                total_count += len(teams_data)
+                # 成功したチームをカウント
+                # validated?がtrue、またはfinal_markが125以上(42の一般的な合格基準)の場合を成功とする
+                success_count += sum(
+                    1 for team in teams_data
+                    if team.get("validated") is True or (team.get("final_mark") or 0) >= 125
+                )
 
                 # レスポンスがper_page未満なら最後のページ
                 if len(teams_data) < per_page:
@@ -171,32 +369,26 @@ class SessionDetailsFetcher:
 
                 page += 1
 
-            total_count = len(all_teams_data)
-            success_count = 0
-
-            # 成功したチームをカウント
-            # validated?がtrue、またはfinal_markが一定以上(例:125以上)の場合を成功とする
-            for team in all_teams_data:
-                if team.get("validated") is True:
-                    success_count += 1
-                elif team.get("final_mark") is not None:
-                    # final_markが125以上の場合も成功とみなす(42の一般的な合格基準)
-                    if team.get("final_mark", 0) >= 125:
-                        success_count += 1
-
             success_rate = success_count / total_count if total_count > 0 else 0.0
 
-            return {
+            team_stats = {
                 "total_count": total_count,
                 "success_count": success_count,
                 "success_rate": success_rate,
             }
+            self._team_stats_cache.set(project_session_id, team_stats)
+            self._team_stats_fallback.set(project_session_id, team_stats)
+            return team_stats
         except Project42Error:
             # Project42Errorはそのまま再スロー
             raise
-        except requests.exceptions.RequestException as e:
+        except _DETAIL_FETCH_ERRORS as e:
+            self.logger.debug("チーム統計情報取得エラー (session_id=%s): %s", project_session_id, e)
+            # 以前に取得できた値があればそれを返す
+            fallback = self._team_stats_fallback.get(project_session_id)
+            if fallback is not None:
+                return fallback
             # エラー時はデフォルト値を返す
-            self.logger.debug(f"チーム統計情報取得エラー (session_id={project_session_id}): {e}")
             return {
                 "total_count": 0,
                 "success_count": 0,
@@ -215,6 +407,8 @@ class SessionDetailsFetcher:
         """
         forbidden_rules = []
         recommended_rules = []
+        add_forbidden = forbidden_rules.append
+        add_recommended = recommended_rules.append
 
         for rule in rules:
             if not isinstance(rule, dict):
@@ -229,15 +423,14 @@ class SessionDetailsFetcher:
                 continue
 
             # ルール名や説明に「forbidden」「禁止」「not allowed」などのキーワードが含まれる場合
-            rule_text_lower = rule_text.lower()
-            if any(keyword in rule_text_lower for keyword in ["forbidden", "禁止", "not allowed", "not permitted"]):
-                forbidden_rules.append(rule_text)
+            if _FORBIDDEN_RE.search(rule_text):
+                add_forbidden(sys.intern(rule_text))
             # ルール名や説明に「recommended」「推奨」「suggested」などのキーワードが含まれる場合
-            elif any(keyword in rule_text_lower for keyword in ["recommended", "推奨", "suggested", "should"]):
-                recommended_rules.append(rule_text)
+            elif _RECOMMENDED_RE.search(rule_text):
+                add_recommended(sys.intern(rule_text))
             # kindがinscription(登録条件)でrequiredがFalseの場合は推奨とみなす
             elif rule_kind == "inscription" and rule.get("required") is False:
-                recommended_rules.append(rule_text)
+                add_recommended(sys.intern(rule_text))
             # kindがinscriptionでrequiredがTrueの場合は必須条件(禁止ではないが、必須として扱う)
             # その他のルールは説明に基づいて判定
 
@@ -251,50 +444,77 @@ class SessionDetailsFetcher:
 
         Returns:
             詳細情報が追加されたプロジェクトセッションオブジェクト
-        """
-        # スキル情報を取得
-        session.skills = self.get_project_session_skills(session.id)
-
-        # 添付ファイル情報を取得
-        session.attachments = self.get_project_session_attachments(session.id)
 
-        # ルール情報を取得
-        session.rules = self.get_project_session_rules(session.id)
+        Raises:
+            AuthenticationError: 認証エラー(401)の場合(セッションは更新しません)
+        """
+        session_id = session.id
+        # 認証ヘッダーは全リクエストで共通のため一度だけ取得する
+        headers = self._auth_headers.get()
+
+        # 並列化は呼び出し側(セッション単位)で行うため、ここでは順に取得する。
+        # 認証エラーなどで例外が送出された場合にセッションを途中まで更新しないよう、
+        # 全ての結果が揃ってから反映する
+        skills = self.get_project_session_skills(session_id, headers)
+        attachments = self.get_project_session_attachments(session_id, headers)
+        rules = self.get_project_session_rules(session_id, headers)
+        scale = self._get_evaluation_scale(session_id, headers)
+        team_stats = self.get_project_session_teams(session_id, headers)
+
+        session.skills = skills
+        session.attachments = attachments
+        session.rules = rules
 
         # ルールをForbidden/Recommendedに分類
-        forbidden_rules, recommended_rules = self.categorize_rules(session.rules)
+        forbidden_rules, recommended_rules = self.categorize_rules(rules)
         session.forbidden_rules = forbidden_rules
         session.recommended_rules = recommended_rules
 
-        # 評価の回数(correction_number)を取得
-        # 評価(evaluations)エンドポイントから取得を試みる
+        # 評価の回数(correction_number)は、スケールを取得できた場合に更新する
+        if scale is not None:
+            session.correction_number = scale.get("correction_number")
+
+        # チーム統計情報
+        session.team_total_count = team_stats.get("total_count")
+        session.team_success_count = team_stats.get("success_count")
+        session.team_success_rate = team_stats.get("success_rate")
+
+        return session
+
+    def _get_evaluation_scale(
+        self,
+        project_session_id: int,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """評価の回数(correction_number)を含むスケール情報を取得
+
+        評価(evaluations)エンドポイントから kind が scale の評価を探し、
+        対応するスケール情報を取得します。
+
+        Args:
+            project_session_id: プロジェクトセッションID
+            headers: リクエストヘッダー(省略時は認証情報から取得)
+
+        Returns:
+            スケール情報(取得できない場合はNone)
+        """
         try:
-            evaluations_url = f"{self.BASE_URL}/v2/project_sessions/{session.id}/evaluations"
-            headers = self.auth.get_headers()
+            evaluations_url = self.SESSION_EVALUATIONS_URL_TEMPLATE % project_session_id
+            if headers is None:
+                headers = self._auth_headers.get()
             response = self.http_client.request("GET", evaluations_url, headers=headers)
+            self._raise_if_unauthorized(response)
             if response.ok:
-                evaluations = response.json()
+                evaluations = APIResponseHandler.parse_json(response)
                 # kindがscaleの場合、correction_numberを取得
                 for eval_item in evaluations:
                     if eval_item.get("kind") == "scale":
                         scale_id = eval_item.get("scale_id")
                         if scale_id:
                             try:
-                                scale_url = f"{self.BASE_URL}/v2/scales/{scale_id}"
-                                scale_response = self.http_client.request("GET", scale_url, headers=headers)
-                                if scale_response.ok:
-                                    scale_data = scale_response.json()
-                                    session.correction_number = scale_data.get("correction_number")
-                                    break
-                            except requests.exceptions.RequestException:
+                                return self._get_reference(self.SCALE_PATH_TEMPLATE % scale_id, headers)
+                            except _DETAIL_FETCH_ERRORS:
                                 pass
-        except requests.exceptions.RequestException:
+        except _DETAIL_FETCH_ERRORS:
             pass
-
-        # チーム統計情報を取得
-        team_stats = self.get_project_session_teams(session.id)
-        session.team_total_count = team_stats.get("total_count")
-        session.team_success_count = team_stats.get("success_count")
-        session.team_success_rate = team_stats.get("success_rate")
-
-        return session
+        return None
@@ -7,6 +7,7 @@ import time
 import logging
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.rate_limiter import RateLimiter
 from src.exceptions import (
@@ -19,6 +20,39 @@ from src.exceptions import (
     RetryExhaustedError,
 )
 
+# リトライせずにそのまま返すステータスコード(呼び出し側で例外に変換する)
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404})
+
+# 通信例外ごとの (ログ表示名, リトライ上限到達時に送出する例外を生成する関数)
+# ConnectTimeoutはConnectionErrorとTimeoutの両方を継承するため、上から順に判定する
+_RETRYABLE_EXCEPTIONS = (
+    (
+        requests.exceptions.ConnectionError,
+        "接続エラー",
+        lambda max_retries, e: ConnectionError(
+            f"APIへの接続に失敗しました。最大リトライ回数({max_retries}回)に達しました",
+            original_error=e
+        ),
+    ),
+    (
+        requests.exceptions.Timeout,
+        "タイムアウトエラー",
+        lambda max_retries, e: TimeoutError(
+            f"リクエストがタイムアウトしました。最大リトライ回数({max_retries}回)に達しました",
+            timeout=None,
+            original_error=e
+        ),
+    ),
+    (
+        requests.exceptions.RequestException,
+        "リクエストエラー",
+        lambda max_retries, e: NetworkError(
+            f"リクエスト中にエラーが発生しました。最大リトライ回数({max_retries}回)に達しました",
+            original_error=e
+        ),
+    ),
+)
+
 
 class HTTPClient:
     """HTTPクライアントクラス
@@ -26,13 +60,16 @@ class HTTPClient:
     リトライ機能とレート制限管理を備えたHTTPリクエスト送信クラスです。
     """
 
+    SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
     def __init__(
         self,
         rate_limiter: Optional[RateLimiter] = None,
         max_retries: int = 3,
         base_delay: float = 0.5,
         max_delay: float = 60.0,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        pool_maxsize: int = 16,
     ):
         """HTTPクライアントの初期化
 
@@ -42,6 +79,7 @@ class HTTPClient:
             base_delay: 基本待機時間(秒)
             max_delay: 最大待機時間(秒)
             logger: ロガー(オプション)
+            pool_maxsize: ホストごとに保持するコネクション数の上限
         """
         self.rate_limiter = rate_limiter
         self.max_retries = max_retries
@@ -49,6 +87,29 @@ class HTTPClient:
         self.max_delay = max_delay
         self.logger = logger or logging.getLogger(__name__)
 
+        # リトライごとの待機時間(指数バックオフ、max_delayで頭打ち)
+        self._backoff_delays = tuple(
+            min(base_delay * (2 ** retry_count), max_delay)
+            for retry_count in range(max_retries + 1)
+        )
+
+        # コネクションを再利用するためのセッション(Keep-Alive / コネクションプール)
+        # リトライは request() 側で行うため、アダプター側のリトライは無効にする
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """セッションを閉じてプール中のコネクションを解放"""
+        self.session.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def request(
         self,
         method: str,
@@ -64,7 +125,7 @@ class HTTPClient:
             url: リクエストURL
             params: クエリパラメータ
             headers: リクエストヘッダー
-            **kwargs: requests.get/postなどの追加引数
+            **kwargs: requests.Session.requestの追加引数
 
         Returns:
             HTTPレスポンス
@@ -76,133 +137,82 @@ class HTTPClient:
         last_exception = None
 
         while retry_count <= self.max_retries:
-            try:
-                # リクエスト情報をログに出力(初回のみ)
-                if retry_count == 0:
-                    self.logger.info(f"リクエスト送信: {method} {url}")
-                    if params:
-                        self.logger.info(f"  パラメータ: {params}")
-
+            # リクエスト情報をログに出力(初回のみ)
+            if retry_count == 0:
+                self.logger.info("リクエスト送信: %s %s", method, url)
+                if params:
+                    self.logger.info("  パラメータ: %s", params)
+            else:
                 # リトライ時はログに出力
-                if retry_count > 0:
-                    self.logger.info(f"リトライ {retry_count}/{self.max_retries}: {method} {url}")
+                self.logger.info("リトライ %d/%d: %s %s", retry_count, self.max_retries, method, url)
 
-                # リクエスト送信前にレート制限の事前制御(1秒間に2回の制限)
-                if self.rate_limiter:
-                    self.rate_limiter.wait_if_needed()
+            # リクエスト送信前にレート制限の事前制御(1秒間に2回の制限)
+            if self.rate_limiter:
+                self.rate_limiter.wait_if_needed()
 
-                # リクエスト送信
+            # リクエスト送信
+            try:
                 response = self._send_request(method, url, params=params, headers=headers, **kwargs)
+            except requests.exceptions.RequestException as e:
+                last_exception = e
+                label, make_error = next(
+                    (label, make_error)
+                    for exc_type, label, make_error in _RETRYABLE_EXCEPTIONS
+                    if isinstance(e, exc_type)
+                )
+                if retry_count >= self.max_retries:
+                    raise make_error(self.max_retries, e) from e
+                self._wait_before_retry(retry_count, label)
+                retry_count += 1
+                continue
 
-                # レート制限ヘッダーをチェック
-                if self.rate_limiter:
-                    self.rate_limiter.check_and_wait(response)
-
-                # 429エラー(Too Many Requests)の処理
-                if response.status_code == 429:
-                    retry_after = self.rate_limiter.get_retry_after(response) if self.rate_limiter else None
-                    if retry_after:
-                        self.logger.warning(
-                            f"レート制限エラー(429): Retry-After={retry_after}秒。"
-                            f"待機してからリトライします... (試行 {retry_count + 1}/{self.max_retries + 1})"
-                        )
-                        time.sleep(retry_after)
-                        retry_count += 1
-                        continue
-
-                    # Retry-Afterがない場合は指数バックオフを使用
-                    if retry_count < self.max_retries:
-                        delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
-                        self.logger.warning(
-                            f"レート制限エラー(429): {delay:.2f}秒待機してからリトライします... "
-                            f"(試行 {retry_count + 1}/{self.max_retries + 1})"
-                        )
-                        time.sleep(delay)
-                        retry_count += 1
-                        continue
-                    else:
-                        raise RateLimitError(
-                            f"レート制限エラー: 最大リトライ回数({self.max_retries}回)に達しました",
-                            retry_after=retry_after,
-                            response_text=response.text
-                        )
-
-                # 400, 401, 403, 404エラーはリトライしない
-                if response.status_code in [400, 401, 403, 404]:
-                    return response
-
-                # その他のエラー(500番台など)はリトライ可能
-                if not response.ok:
-                    if retry_count < self.max_retries:
-                        delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
-                        self.logger.warning(
-                            f"HTTPエラー {response.status_code}: {delay:.2f}秒待機してからリトライします... "
-                            f"(試行 {retry_count + 1}/{self.max_retries + 1})"
-                        )
-                        time.sleep(delay)
-                        retry_count += 1
-                        continue
-                    else:
-                        raise APIError(
-                            f"HTTPエラー {response.status_code}: 最大リトライ回数({self.max_retries}回)に達しました",
-                            status_code=response.status_code,
-                            response_text=response.text
-                        )
-
-                # 成功
-                return response
+            # 42 APIはUTF-8で応答するため、response.text参照時の文字コード推定を省略する
+            if response.encoding is None:
+                response.encoding = "utf-8"
 
-            except requests.exceptions.ConnectionError as e:
-                last_exception = e
-                if retry_count < self.max_retries:
-                    delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
-                    self.logger.warning(
-                        f"接続エラー: {delay:.2f}秒待機してからリトライします... "
-                        f"(試行 {retry_count + 1}/{self.max_retries + 1})"
-                    )
-                    time.sleep(delay)
-                    retry_count += 1
-                    continue
-                else:
-                    raise ConnectionError(
-                        f"APIへの接続に失敗しました。最大リトライ回数({self.max_retries}回)に達しました",
-                        original_error=e
-                    ) from e
+            # レート制限ヘッダーをチェック
+            if self.rate_limiter:
+                self.rate_limiter.check_and_wait(response)
 
-            except requests.exceptions.Timeout as e:
-                last_exception = e
-                if retry_count < self.max_retries:
-                    delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
+            status_code = response.status_code
+
+            # 429エラー(Too Many Requests)の処理
+            if status_code == 429:
+                retry_after = self.rate_limiter.get_retry_after(response) if self.rate_limiter else None
+                if retry_after:
                     self.logger.warning(
-                        f"タイムアウトエラー: {delay:.2f}秒待機してからリトライします... "
-                        f"(試行 {retry_count + 1}/{self.max_retries + 1})"
+                        "レート制限エラー(429): Retry-After=%s秒。"
+                        "待機してからリトライします... (試行 %d/%d)",
+                        retry_after, retry_count + 1, self.max_retries + 1
                     )
-                    time.sleep(delay)
+                    time.sleep(retry_after)
                     retry_count += 1
                     continue
-                else:
-                    raise TimeoutError(
-                        f"リクエストがタイムアウトしました。最大リトライ回数({self.max_retries}回)に達しました",
-                        timeout=None,
-                        original_error=e
-                    ) from e
 
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if retry_count < self.max_retries:
-                    delay = min(self.base_delay * (2 ** retry_count), self.max_delay)
-                    self.logger.warning(
-                        f"リクエストエラー: {delay:.2f}秒待機してからリトライします... "
-                        f"(試行 {retry_count + 1}/{self.max_retries + 1})"
+                # Retry-Afterがない場合は指数バックオフを使用
+                if retry_count >= self.max_retries:
+                    raise RateLimitError(
+                        f"レート制限エラー: 最大リトライ回数({self.max_retries}回)に達しました",
+                        retry_after=retry_after,
+                        response_text=response.text
                     )
-                    time.sleep(delay)
-                    retry_count += 1
-                    continue
-                else:
-                    raise NetworkError(
-                        f"リクエスト中にエラーが発生しました。最大リトライ回数({self.max_retries}回)に達しました",
-                        original_error=e
-                    ) from e
+                self._wait_before_retry(retry_count, "レート制限エラー(429)")
+                retry_count += 1
+                continue
+
+            # 成功、または400, 401, 403, 404エラー(リトライしない)
+            if response.ok or status_code in _NON_RETRYABLE_STATUS:
+                return response
+
+            # その他のエラー(500番台など)はリトライ可能
+            if retry_count >= self.max_retries:
+                raise APIError(
+                    f"HTTPエラー {status_code}: 最大リトライ回数({self.max_retries}回)に達しました",
+                    status_code=status_code,
+                    response_text=response.text
+                )
+            self._wait_before_retry(retry_count, f"HTTPエラー {status_code}")
+            retry_count += 1
 
         # 最大リトライ回数に達した場合
         raise RetryExhaustedError(
@@ -211,6 +221,20 @@ class HTTPClient:
             last_error=last_exception
         )
 
+    def _wait_before_retry(self, retry_count: int, reason: str) -> None:
+        """指数バックオフで待機
+
+        Args:
+            retry_count: これまでのリトライ回数
+            reason: ログに出力する待機理由
+        """
+        delay = self._backoff_delays[retry_count]
+        self.logger.warning(
+            "%s: %.2f秒待機してからリトライします... (試行 %d/%d)",
+            reason, delay, retry_count + 1, self.max_retries + 1
+        )
+        time.sleep(delay)
+
     def _send_request(
         self,
         method: str,
@@ -226,7 +250,7 @@ class HTTPClient:
             url: リクエストURL
             params: クエリパラメータ
             headers: リクエストヘッダー
-            **kwargs: requests.get/postなどの追加引数
+            **kwargs: requests.Session.requestの追加引数
 
         Returns:
             HTTPレスポンス
@@ -235,13 +259,6 @@ class HTTPClient:
             ValidationError: サポートされていないHTTPメソッドの場合
         """
         method_upper = method.upper()
-        if method_upper == "GET":
-            return requests.get(url, headers=headers, params=params, **kwargs)
-        elif method_upper == "POST":
-            return requests.post(url, headers=headers, params=params, **kwargs)
-        elif method_upper == "PUT":
-            return requests.put(url, headers=headers, params=params, **kwargs)
-        elif method_upper == "DELETE":
-            return requests.delete(url, headers=headers, params=params, **kwargs)
-        else:
+        if method_upper not in self.SUPPORTED_METHODS:
             raise ValidationError(f"サポートされていないHTTPメソッド: {method}")
+        return self.session.request(method_upper, url, headers=headers, params=params, **kwargs)
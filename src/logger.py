@@ -3,9 +3,31 @@
 アプリケーション全体のロギング設定を管理します。
 """
 import sys
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+# ロガー名ごとの出力用リスナー(再設定時・終了時に停止する)
+_listeners: Dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """指定ロガーのリスナーを停止(キューに残ったログを出力してから終了)"""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def _stop_all_listeners() -> None:
+    """全てのリスナーを停止"""
+    for name in list(_listeners):
+        _stop_listener(name)
+
+
+atexit.register(_stop_all_listeners)
 
 
 def setup_logger(
@@ -24,12 +46,18 @@ def setup_logger(
 
     Returns:
         設定済みのロガー
+
+    Note:
+        ファイル・コンソールへの書き込みはバックグラウンドスレッドで行うため、
+        ログ出力の呼び出し元はディスクや標準出力のI/Oを待ちません。
     """
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
-    # 既存のハンドラーをクリア(重複を防ぐ)
+    # 既存のハンドラーとリスナーをクリア(重複を防ぐ)
+    _stop_listener(name)
     logger.handlers.clear()
+    handlers: List[logging.Handler] = []
 
     # ファイルハンドラー(ログファイルに記録)
     if log_file:
@@ -44,7 +72,7 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # コンソールハンドラー(標準出力にも記録)
     if console:
@@ -55,6 +83,14 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # ロガーにはキューへの追加のみを行うハンドラーを設定し、実際の出力はリスナーが行う
+    if handlers:
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
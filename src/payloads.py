@@ -2,11 +2,17 @@
 
 APIレスポンスからデータオブジェクトへの変換処理を行います。
 """
+import sys
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+def _item_names(items: Optional[List[Dict[str, Any]]]) -> List[str]:
+    """{"name": ...} 形式の要素のリストから名前だけを取り出す(欠損・Noneは空として扱う)"""
+    return [item.get("name", "") for item in items or ()]
+
+
+@dataclass(slots=True)
 class Project:
     """42のプロジェクト情報を保持するデータクラス"""
     id: int
@@ -25,48 +31,50 @@ class Project:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
+    # APIレスポンスの値をそのまま使うフィールドと、キーが無い場合のデフォルト値
+    _API_FIELDS = (
+        ("id", None),
+        ("name", ""),
+        ("slug", ""),
+        ("description", None),
+        ("tier", None),
+        ("difficulty", None),
+        ("duration", None),
+        ("exam", False),
+        ("repository", None),
+        ("parent_id", None),
+        ("created_at", None),
+        ("updated_at", None),
+    )
+
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "Project":
         """APIレスポンスからProjectオブジェクトを作成"""
-        return cls(
-            id=data.get("id"),
-            name=data.get("name", ""),
-            slug=data.get("slug", ""),
-            description=data.get("description"),
-            tier=data.get("tier"),
-            difficulty=data.get("difficulty"),
-            duration=data.get("duration"),
-            objectives=[obj.get("name", "") for obj in data.get("objectives", [])],
-            attachments=data.get("attachments", []),
-            tags=[tag.get("name", "") for tag in data.get("tags", [])],
-            exam=data.get("exam", False),
-            repository=data.get("repository"),
-            parent_id=data.get("parent_id"),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at"),
-        )
+        return cls(**cls.dict_from_api_response(data), attachments=data.get("attachments", []))
+
+    @classmethod
+    def dict_from_api_response(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """APIレスポンスを to_dict() と同じキーを持つ辞書に変換
+
+        辞書しか使わない場合に、Projectオブジェクトの生成を省略するために使用します。
+        """
+        get = data.get
+        shaped = {key: get(key, default) for key, default in cls._API_FIELDS}
+        shaped["objectives"] = _item_names(get("objectives"))
+        shaped["tags"] = list(map(sys.intern, _item_names(get("tags"))))  # 同じタグ名は共有
+        return shaped
 
     def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "slug": self.slug,
-            "description": self.description,
-            "tier": self.tier,
-            "difficulty": self.difficulty,
-            "duration": self.duration,
-            "objectives": self.objectives,
-            "tags": self.tags,
-            "exam": self.exam,
-            "repository": self.repository,
-            "parent_id": self.parent_id,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        """辞書形式に変換(attachments以外の全フィールドを含む)"""
+        return {name: getattr(self, name) for name in _PROJECT_FIELD_NAMES}
+
 
+# フィールド定義から導出するため、フィールドを追加してもto_dictの修正は不要
+# (attachmentsは従来どおりto_dictの対象外とする)
+_PROJECT_FIELD_NAMES = tuple(f.name for f in fields(Project) if f.name != "attachments")
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectSession:
     """42のプロジェクトセッション情報を保持するデータクラス
 
@@ -103,65 +111,52 @@ class ProjectSession:
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "ProjectSession":
         """APIレスポンスからProjectSessionオブジェクトを作成"""
-        project = data.get("project", {})
-        cursus = data.get("cursus", {})
-
-        return cls(
-            id=data.get("id"),
-            project_id=project.get("id") if project else None,
-            project_name=project.get("name", ""),
-            project_slug=project.get("slug", ""),
-            description=project.get("description"),
-            xp=project.get("difficulty"),  # difficultyがXP/難易度を示す
-            creation_date=data.get("created_at"),
-            cursus_id=cursus.get("id") if cursus else None,
-            cursus_name=cursus.get("name") if cursus else None,
-            cursus_slug=cursus.get("slug") if cursus else None,
-            max_people=data.get("max_people"),
-            solo=data.get("solo"),
-            correction_number=None,  # 後で取得
-            keywords=[tag.get("name", "") for tag in project.get("tags", [])],
-            skills=[],  # 後で取得
-            attachments=[],  # 後で取得
-            is_subscriptable=data.get("is_subscriptable"),
-            begin_at=data.get("begin_at"),
-            end_at=data.get("end_at"),
-            rules=[],  # 後で取得
-            status=data.get("status"),  # 進行ステータス
-            forbidden_rules=[],  # 後で取得
-            recommended_rules=[],  # 後で取得
-            team_total_count=None,  # 後で取得
-            team_success_count=None,  # 後で取得
-            team_success_rate=None,  # 後で取得
-        )
+        return cls(**cls.dict_from_api_response(data))
+
+    @staticmethod
+    def dict_from_api_response(data: Dict[str, Any]) -> Dict[str, Any]:
+        """APIレスポンスを to_dict() と同じ形式の辞書に変換
+
+        辞書しか使わない場合に、ProjectSessionオブジェクトの生成を省略するために使用します。
+        """
+        get = data.get
+        project = get("project") or {}
+        cursus = get("cursus") or {}
+        project_get = project.get
+        cursus_get = cursus.get
 
-    def to_dict(self) -> Dict[str, Any]:
-        """辞書形式に変換"""
         return {
-            "id": self.id,
-            "project_id": self.project_id,
-            "project_name": self.project_name,
-            "project_slug": self.project_slug,
-            "description": self.description,
-            "xp": self.xp,
-            "creation_date": self.creation_date,
-            "cursus_id": self.cursus_id,
-            "cursus_name": self.cursus_name,
-            "cursus_slug": self.cursus_slug,
-            "max_people": self.max_people,
-            "solo": self.solo,
-            "correction_number": self.correction_number,
-            "keywords": self.keywords,
-            "skills": self.skills,
-            "attachments": self.attachments,
-            "is_subscriptable": self.is_subscriptable,
-            "begin_at": self.begin_at,
-            "end_at": self.end_at,
-            "rules": self.rules,
-            "status": self.status,
-            "forbidden_rules": self.forbidden_rules,
-            "recommended_rules": self.recommended_rules,
-            "team_total_count": self.team_total_count,
-            "team_success_count": self.team_success_count,
-            "team_success_rate": self.team_success_rate,
+            "id": get("id"),
+            "project_id": project_get("id"),
+            "project_name": project_get("name", ""),
+            "project_slug": project_get("slug", ""),
+            "description": project_get("description"),
+            "xp": project_get("difficulty"),  # difficultyがXP/難易度を示す
+            "creation_date": get("created_at"),
+            "cursus_id": cursus_get("id"),
+            "cursus_name": cursus_get("name"),
+            "cursus_slug": cursus_get("slug"),
+            "max_people": get("max_people"),
+            "solo": get("solo"),
+            "correction_number": None,  # 後で取得
+            "keywords": list(map(sys.intern, _item_names(project_get("tags")))),  # 同じタグ名は共有
+            "skills": [],  # 後で取得
+            "attachments": [],  # 後で取得
+            "is_subscriptable": get("is_subscriptable"),
+            "begin_at": get("begin_at"),
+            "end_at": get("end_at"),
+            "rules": [],  # 後で取得
+            "status": get("status"),  # 進行ステータス
+            "forbidden_rules": [],  # 後で取得
+            "recommended_rules": [],  # 後で取得
+            "team_total_count": None,  # 後で取得
+            "team_success_count": None,  # 後で取得
+            "team_success_rate": None,  # 後で取得
         }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換(全フィールドを含む)"""
+        return {name: getattr(self, name) for name in _PROJECT_SESSION_FIELD_NAMES}
+
+
+_PROJECT_SESSION_FIELD_NAMES = tuple(f.name for f in fields(ProjectSession))
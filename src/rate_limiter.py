@@ -38,7 +38,7 @@ class RateLimiter:
         self.min_interval = 1.0 / requests_per_second  # 1秒間に2回 = 0.5秒間隔
         self.logger = logger or logging.getLogger(__name__)
 
-        # 最後のリクエスト時刻を記録(スレッドセーフのためLockを使用)
+        # 最後に予約したリクエスト送信時刻(time.monotonic()基準、スレッドセーフのためLockを使用)
         self._last_request_time: Optional[float] = None
         self._lock = Lock()
 
@@ -48,23 +48,24 @@ class RateLimiter:
         1秒間に2リクエストという制限を守るため、
         最後のリクエストから最低0.5秒経過するまで待機します。
         """
+        # 送信時刻の枠だけをロック内で予約し、待機はロックの外で行う
+        # (時刻はシステム時計の変更の影響を受けない time.monotonic() で管理する)
         with self._lock:
-            current_time = time.time()
-
-            if self._last_request_time is not None:
-                elapsed = current_time - self._last_request_time
-
-                if elapsed < self.min_interval:
-                    wait_time = self.min_interval - elapsed
-                    self.logger.debug(
-                        f"レート制限事前制御: 前回リクエストから{elapsed:.3f}秒経過。"
-                        f"{wait_time:.3f}秒待機します(1秒間に{self.requests_per_second}回の制限)"
-                    )
-                    time.sleep(wait_time)
-                    current_time = time.time()
-
-            # リクエスト時刻を記録
-            self._last_request_time = current_time
+            current_time = time.monotonic()
+            last_request_time = self._last_request_time
+            if last_request_time is None:
+                send_time = current_time
+            else:
+                send_time = max(current_time, last_request_time + self.min_interval)
+            self._last_request_time = send_time
+
+        wait_time = send_time - current_time
+        if wait_time > 0:
+            self.logger.debug(
+                "レート制限事前制御: %.3f秒待機します(1秒間に%s回の制限)",
+                wait_time, self.requests_per_second
+            )
+            time.sleep(wait_time)
 
     def check_and_wait(self, response: requests.Response) -> None:
         """レート制限ヘッダーをチェックし、必要に応じて待機
@@ -79,7 +80,7 @@ class RateLimiter:
         if rate_limit_remaining:
             try:
                 remaining = int(rate_limit_remaining)
-                self.logger.debug(f"レート制限残り: {remaining}リクエスト")
+                self.logger.debug("レート制限残り: %dリクエスト", remaining)
 
                 # 残りが閾値以下の場合、リセット時刻まで待機
                 if remaining <= self.threshold:
@@ -91,31 +92,32 @@ class RateLimiter:
 
                             if wait_time > 0:
                                 self.logger.warning(
-                                    f"レート制限が近づいています(残り: {remaining})。"
-                                    f"{wait_time}秒待機します..."
+                                    "レート制限が近づいています(残り: %s)。%s秒待機します...",
+                                    remaining, wait_time
                                 )
                                 time.sleep(wait_time)
                                 # 待機後、最後のリクエスト時刻を更新
                                 with self._lock:
-                                    self._last_request_time = time.time()
+                                    # 他のスレッドが予約済みの送信時刻より前には戻さない
+                                    self._last_request_time = max(self._last_request_time or 0.0, time.monotonic())
                         except (ValueError, TypeError):
                             # リセット時刻が取得できない場合は基本待機時間を使用
                             self.logger.warning(
-                                f"レート制限が近づいています(残り: {remaining})。"
-                                f"{self.base_delay}秒待機します..."
+                                "レート制限が近づいています(残り: %s)。%s秒待機します...",
+                                remaining, self.base_delay
                             )
                             time.sleep(self.base_delay)
                             with self._lock:
-                                self._last_request_time = time.time()
+                                self._last_request_time = max(self._last_request_time or 0.0, time.monotonic())
                     else:
                         # リセット時刻が不明な場合は基本待機時間を使用
                         self.logger.warning(
-                            f"レート制限が近づいています(残り: {remaining})。"
-                            f"{self.base_delay}秒待機します..."
+                            "レート制限が近づいています(残り: %s)。%s秒待機します...",
+                            remaining, self.base_delay
                         )
                         time.sleep(self.base_delay)
                         with self._lock:
-                            self._last_request_time = time.time()
+                            self._last_request_time = max(self._last_request_time or 0.0, time.monotonic())
             except (ValueError, TypeError):
                 # ヘッダーの値が無効な場合は無視
                 pass